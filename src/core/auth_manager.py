@@ -9,6 +9,7 @@ alongside the original per-platform JSON files for backward compatibility.
 
 import json
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,8 @@ class AuthManager:
         self._auth_dir = get_auth_dir()
         self._dev_auth_dir = self._find_dev_auth_dir()
         self._accounts: list[AccountConfig] = []
+        self._by_id: dict[str, AccountConfig] = {}
+        self._by_platform: defaultdict[str, list[AccountConfig]] = defaultdict(list)
         self._accounts_path = get_app_data_dir() / 'accounts_config.json'
         self._load_accounts()
 
@@ -45,15 +48,8 @@ class AuthManager:
             try:
                 with open(self._accounts_path) as f:
                     data = json.load(f)
-                self._accounts = [
-                    AccountConfig(
-                        platform_id=a['platform_id'],
-                        account_id=a['account_id'],
-                        profile_name=a.get('profile_name', ''),
-                        enabled=a.get('enabled', True),
-                    )
-                    for a in data.get('accounts', [])
-                ]
+                self._accounts = [AccountConfig.from_dict(a) for a in data.get('accounts', [])]
+                self._rebuild_account_index()
                 return
             except (OSError, json.JSONDecodeError, KeyError) as e:
                 get_logger().warning(f'Failed to load accounts config: {e}')
@@ -98,22 +94,24 @@ class AuthManager:
             )
 
         self._accounts = migrated
+        self._rebuild_account_index()
         if migrated:
             self._save_accounts()
 
+    def _rebuild_account_index(self):
+        """Rebuild the account_id and platform_id lookup indexes."""
+        self._by_id = {}
+        self._by_platform = defaultdict(list)
+        for a in self._accounts:
+            self._index_account(a)
+
+    def _index_account(self, account: AccountConfig):
+        self._by_id[account.account_id] = account
+        self._by_platform[account.platform_id].append(account)
+
     def _save_accounts(self):
         """Persist accounts_config.json."""
-        data = {
-            'accounts': [
-                {
-                    'platform_id': a.platform_id,
-                    'account_id': a.account_id,
-                    'profile_name': a.profile_name,
-                    'enabled': a.enabled,
-                }
-                for a in self._accounts
-            ]
-        }
+        data = {'accounts': [a.to_dict() for a in self._accounts]}
         self._accounts_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self._accounts_path, 'w') as f:
             json.dump(data, f, indent=4)
@@ -124,29 +122,31 @@ class AuthManager:
 
     def get_accounts_for_platform(self, platform_id: str) -> list[AccountConfig]:
         """Return accounts for a specific platform."""
-        return [a for a in self._accounts if a.platform_id == platform_id]
+        return list(self._by_platform.get(platform_id, ()))
 
     def get_account(self, account_id: str) -> AccountConfig | None:
         """Return a specific account by its ID."""
-        for a in self._accounts:
-            if a.account_id == account_id:
-                return a
-        return None
+        return self._by_id.get(account_id)
 
     def add_account(self, account: AccountConfig):
         """Add a new account and persist."""
         existing = self.get_account(account.account_id)
         if existing:
+            moved = existing.platform_id != account.platform_id
             existing.platform_id = account.platform_id
             existing.profile_name = account.profile_name
             existing.enabled = account.enabled
+            if moved:
+                self._rebuild_account_index()
         else:
             self._accounts.append(account)
+            self._index_account(account)
         self._save_accounts()
 
     def remove_account(self, account_id: str):
         """Remove an account by ID and persist."""
         self._accounts = [a for a in self._accounts if a.account_id != account_id]
+        self._rebuild_account_index()
         self._save_accounts()
 
     # ── Account-based credential storage ────────────────────────────
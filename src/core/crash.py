@@ -0,0 +1,144 @@
+"""Crash logging: unhandled-exception hooks and the fatal-error log.
+
+Kept free of GUI imports so the hooks can be installed (and tested) without
+loading Qt; QMessageBox is only imported when an exception is reported.
+"""
+
+import contextlib
+import sys
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+from src.core.logger import get_logger
+from src.utils.helpers import get_logs_dir
+
+_FAULT_LOG_FILE = None
+_FAULT_LOG_STACK = contextlib.ExitStack()
+
+
+class CrashLogWriter:
+    def __init__(self, file_handle):
+        self._file = file_handle
+        self._pending_timestamp = True
+
+    def write(self, text):
+        if self._pending_timestamp and (
+            'Windows fatal exception' in text or 'Fatal Python error' in text
+        ):
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._file.write(f'\n[{timestamp}] ')
+            self._pending_timestamp = False
+        self._file.write(text)
+
+    def flush(self):
+        self._file.flush()
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return False
+
+    def write_marker(self, label: str) -> None:
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._file.write(f'\n[{timestamp}] {label}\n')
+        self._file.flush()
+
+
+def install_exception_logging():
+    """Route unhandled main-thread and worker-thread exceptions to the logs."""
+    logger = get_logger()
+    enable_fault_handler()
+
+    def handle_exception(exc_type, exc, tb):
+        logger.error('Unhandled exception', exc_info=(exc_type, exc, tb))
+        flush_logger(logger)
+        write_crash_log(exc_type, exc, tb, context='sys')
+        _show_unexpected_error()
+
+    def handle_thread_exception(args):
+        logger.error(
+            'Unhandled thread exception',
+            exc_info=(args.exc_type, args.exc_value, args.exc_traceback),
+        )
+        flush_logger(logger)
+        write_crash_log(args.exc_type, args.exc_value, args.exc_traceback, context='thread')
+
+    sys.excepthook = handle_exception
+    if hasattr(threading, 'excepthook'):
+        threading.excepthook = handle_thread_exception
+
+
+def _show_unexpected_error():
+    """Tell the user about an unhandled exception; Qt is imported only here."""
+    from PyQt6.QtWidgets import QMessageBox
+
+    QMessageBox.critical(
+        None,
+        'Unexpected Error',
+        'An unexpected error occurred. Please send your logs to Jas for support.',
+    )
+
+
+def enable_fault_handler():
+    """Send faulthandler output for hard crashes to fatal_errors.log."""
+    global _FAULT_LOG_FILE
+    if _FAULT_LOG_FILE is not None:
+        return
+    try:
+        import faulthandler
+
+        crash_dir = get_logs_dir()
+        crash_dir.mkdir(parents=True, exist_ok=True)
+        fault_path = crash_dir / 'fatal_errors.log'
+        raw_file = _FAULT_LOG_STACK.enter_context(
+            open(fault_path, 'a', encoding='utf-8')  # noqa: SIM115
+        )
+        _FAULT_LOG_FILE = CrashLogWriter(raw_file)
+        _FAULT_LOG_FILE.write_marker('Fatal error logging enabled')
+        faulthandler.enable(file=_FAULT_LOG_FILE, all_threads=True)
+    except Exception:
+        return
+
+
+def write_fatal_marker(label: str) -> None:
+    if _FAULT_LOG_FILE is None:
+        return
+    try:
+        _FAULT_LOG_FILE.write_marker(label)
+    except Exception:
+        return
+
+
+def flush_logger(logger):
+    for handler in list(logger.handlers):
+        try:
+            handler.flush()
+        except Exception:
+            continue
+
+
+def write_crash_log(exc_type, exc, tb, *, context: str) -> Path | None:
+    """Write a crash_<timestamp>.log file and return its path, or None on failure."""
+    try:
+        crash_dir = get_logs_dir()
+        crash_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        crash_file = crash_dir / f'crash_{timestamp}.log'
+        details = ''.join(traceback.format_exception(exc_type, exc, tb))
+        header = [
+            f'Context: {context}',
+            f'Exception: {getattr(exc_type, "__name__", str(exc_type))}',
+            f'Message: {exc}',
+        ]
+        if getattr(sys, 'frozen', False):
+            header.append('Frozen: True')
+        crash_file.write_text('\n'.join(header) + '\n\n' + details, encoding='utf-8')
+    except Exception:
+        return None
+    return crash_file
@@ -25,6 +25,7 @@ class ProcessedImage:
     format: str
     quality: int
     meets_requirements: bool
+    mode: str
     warning: str | None = None
 
 
@@ -243,6 +244,7 @@ def process_image(
             format=out_format,
             quality=quality,
             meets_requirements=meets,
+            mode=img.mode,
             warning=warning,
         )
     except Exception as exc:
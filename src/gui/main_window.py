@@ -47,7 +47,7 @@ from src.platforms.onlyfans import OnlyFansPlatform
 from src.platforms.snapchat import SnapchatPlatform
 from src.platforms.twitter import TwitterPlatform
 from src.utils.constants import APP_NAME, APP_VERSION, PostResult
-from src.utils.helpers import get_drafts_dir, get_logs_dir, get_resource_path
+from src.utils.helpers import get_downloads_dir, get_drafts_dir, get_logs_dir, get_resource_path
 from src.utils.theme import apply_theme, resolve_theme_mode
 
 
@@ -1097,10 +1097,8 @@ class MainWindow(QMainWindow):
             )
             return
 
-        downloads_dir = Path.home() / 'Downloads'
-        downloads_dir.mkdir(parents=True, exist_ok=True)
         filename = f'GaleFling-Setup-v{update.latest_version}.exe'
-        target_path = downloads_dir / filename
+        target_path = get_downloads_dir() / filename
 
         progress = QProgressDialog('Downloading update...', None, 0, 100, self)
         progress.setWindowTitle('Downloading Update')
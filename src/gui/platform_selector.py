@@ -17,7 +17,7 @@ class PlatformSelector(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._checkboxes: dict[str, QCheckBox] = {}
-        self._accounts: list[AccountConfig] = []
+        self._accounts: dict[str, AccountConfig] = {}
         self._init_ui()
 
     def _init_ui(self):
@@ -37,7 +37,7 @@ class PlatformSelector(QWidget):
             cb.setParent(None)
             cb.deleteLater()
         self._checkboxes.clear()
-        self._accounts = accounts
+        self._accounts = {a.account_id: a for a in accounts}
 
         # Build checkboxes in a 2-column grid
         for i, account in enumerate(accounts):
@@ -87,10 +87,7 @@ class PlatformSelector(QWidget):
         cb.setText(label)
 
     def _get_account(self, account_id: str) -> AccountConfig | None:
-        for a in self._accounts:
-            if a.account_id == account_id:
-                return a
-        return None
+        return self._accounts.get(account_id)
 
     @staticmethod
     def _format_account_label(
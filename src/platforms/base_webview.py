@@ -16,6 +16,24 @@ from src.platforms.base import BasePlatform
 from src.utils.constants import PostResult
 from src.utils.helpers import get_app_data_dir
 
+# has_valid_session() verdicts keyed on (cookie DB path, domains), stored with
+# the stat signature they were computed from. Platforms are rebuilt on every
+# refresh, so this lives at module level rather than on the instance.
+_SESSION_CACHE: dict[tuple[Path, tuple[str, ...]], tuple[tuple[int, ...], bool]] = {}
+
+
+def _cookie_db_signature(cookie_path: Path) -> tuple[int, ...] | None:
+    """Return mtime/size of the cookie DB and its WAL, or None if the DB is missing."""
+    try:
+        st = cookie_path.stat()
+    except OSError:
+        return None
+    signature: tuple[int, ...] = (st.st_mtime_ns, st.st_size)
+    with contextlib.suppress(OSError):
+        wal = cookie_path.with_name(cookie_path.name + '-wal').stat()
+        signature += (wal.st_mtime_ns, wal.st_size)
+    return signature
+
 
 class BaseWebViewPlatform(BasePlatform):
     """Abstract base for platforms that use an embedded browser for posting.
@@ -26,6 +44,7 @@ class BaseWebViewPlatform(BasePlatform):
 
     Subclasses may override:
         SUCCESS_URL_PATTERN: str — regex matching a post permalink URL
+            (compiled once per subclass into SUCCESS_URL_REGEX)
         SUCCESS_SELECTOR: str — CSS selector for a DOM element indicating success
         PERMALINK_SELECTOR: str — CSS selector for a permalink element after success
         PREFILL_DELAY_MS: int — delay before injecting text (for Cloudflare sites)
@@ -43,6 +62,14 @@ class BaseWebViewPlatform(BasePlatform):
     POLL_INTERVAL_MS: int = 500
     POLL_TIMEOUT_MS: int = 30000
 
+    SUCCESS_URL_REGEX: re.Pattern[str] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # urlChanged fires on every navigation; compile the pattern once here.
+        pattern = cls.SUCCESS_URL_PATTERN
+        cls.SUCCESS_URL_REGEX = re.compile(pattern) if pattern else None
+
     def __init__(
         self,
         account_id: str = '',
@@ -92,21 +119,28 @@ class BaseWebViewPlatform(BasePlatform):
         if not self.COOKIE_DOMAINS:
             return False
         cookie_path = self._get_cookie_db_path()
-        if not cookie_path.exists():
+        signature = _cookie_db_signature(cookie_path)
+        if signature is None:
             return False
+        cache_key = (cookie_path, tuple(self.COOKIE_DOMAINS))
+        cached = _SESSION_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        # One suffix match per domain, OR'd into a single query.
+        where = ' OR '.join('host_key LIKE ?' for _ in self.COOKIE_DOMAINS)
+        params = [f'%{domain}' for domain in self.COOKIE_DOMAINS]
         try:
-            with sqlite3.connect(cookie_path) as conn:
-                cursor = conn.cursor()
-                for domain in self.COOKIE_DOMAINS:
-                    cursor.execute(
-                        'SELECT host_key FROM cookies WHERE host_key LIKE ? LIMIT 1',
-                        (f'%{domain}',),
-                    )
-                    if cursor.fetchone():
-                        return True
+            # Read-only: QtWebEngine owns this file, we only peek at it. sqlite3's
+            # own context manager only commits; closing() releases the handle.
+            uri = f'{cookie_path.as_uri()}?mode=ro'
+            with contextlib.closing(sqlite3.connect(uri, uri=True)) as conn:
+                row = conn.execute(
+                    f'SELECT 1 FROM cookies WHERE {where} LIMIT 1', params
+                ).fetchone()
         except sqlite3.Error:
             return False
-        return False
+        _SESSION_CACHE[cache_key] = (signature, row is not None)
+        return row is not None
 
     def get_webview(self) -> QWebEngineView | None:
         """Return the existing WebEngineView, if created."""
@@ -201,7 +235,7 @@ class BaseWebViewPlatform(BasePlatform):
     def _on_url_changed(self, url: QUrl):
         """Monitor URL changes for post-submission redirects."""
         url_string = url.toString()
-        if self.SUCCESS_URL_PATTERN and re.search(self.SUCCESS_URL_PATTERN, url_string):
+        if self.SUCCESS_URL_REGEX is not None and self.SUCCESS_URL_REGEX.search(url_string):
             self._captured_post_url = url_string
             self._post_confirmed = True
             get_logger().info(
@@ -1,5 +1,7 @@
 """Platform specifications, error codes, and application constants."""
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -10,15 +12,20 @@ LOG_UPLOAD_ENDPOINT = 'https://galepost.jasmer.tools/logs/upload'
 
 DRAFT_AUTO_SAVE_INTERVAL_SECONDS = 30
 
+# Shared supported-format sets, reused across the platform specs below.
+_FMT_JPEG_PNG = frozenset({'JPEG', 'PNG'})
+_FMT_JPEG_PNG_WEBP = frozenset({'JPEG', 'PNG', 'WEBP'})
+_FMT_JPEG_PNG_GIF_WEBP = frozenset({'JPEG', 'PNG', 'GIF', 'WEBP'})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PlatformSpecs:
     """Platform-specific constraints and capabilities."""
 
     platform_name: str
     max_image_dimensions: tuple[int, int]
     max_file_size_mb: float
-    supported_formats: list[str]
+    supported_formats: frozenset[str]
     max_text_length: int | None
     requires_facets: bool = False
     platform_color: str = '#000000'
@@ -29,7 +36,7 @@ class PlatformSpecs:
     has_cloudflare: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountConfig:
     """Configuration for a single platform account."""
 
@@ -38,12 +45,36 @@ class AccountConfig:
     profile_name: str
     enabled: bool = True
 
+    def __post_init__(self):
+        # Platform IDs loaded from JSON are fresh strings; intern them so
+        # PLATFORM_SPECS_MAP lookups hit the identity fast path.
+        self.platform_id = sys.intern(self.platform_id)
+
+    def to_dict(self) -> dict:
+        """Return the JSON-serializable form stored in accounts_config.json."""
+        return {
+            'platform_id': self.platform_id,
+            'account_id': self.account_id,
+            'profile_name': self.profile_name,
+            'enabled': self.enabled,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AccountConfig':
+        """Build an account from an accounts_config.json entry."""
+        return cls(
+            platform_id=data['platform_id'],
+            account_id=data['account_id'],
+            profile_name=data.get('profile_name', ''),
+            enabled=data.get('enabled', True),
+        )
+
 
 TWITTER_SPECS = PlatformSpecs(
     platform_name='Twitter',
     max_image_dimensions=(4096, 4096),
     max_file_size_mb=5.0,
-    supported_formats=['JPEG', 'PNG', 'GIF', 'WEBP'],
+    supported_formats=_FMT_JPEG_PNG_GIF_WEBP,
     max_text_length=280,
     requires_facets=False,
     platform_color='#1DA1F2',
@@ -56,7 +87,7 @@ BLUESKY_SPECS = PlatformSpecs(
     platform_name='Bluesky',
     max_image_dimensions=(2000, 2000),
     max_file_size_mb=1.0,
-    supported_formats=['JPEG', 'PNG'],
+    supported_formats=_FMT_JPEG_PNG,
     max_text_length=300,
     requires_facets=True,
     platform_color='#0085FF',
@@ -69,7 +100,7 @@ INSTAGRAM_SPECS = PlatformSpecs(
     platform_name='Instagram',
     max_image_dimensions=(1440, 1440),
     max_file_size_mb=8.0,
-    supported_formats=['JPEG', 'PNG'],
+    supported_formats=_FMT_JPEG_PNG,
     max_text_length=2200,
     platform_color='#E1306C',
     api_type='graph_api',
@@ -81,7 +112,7 @@ SNAPCHAT_SPECS = PlatformSpecs(
     platform_name='Snapchat',
     max_image_dimensions=(1080, 1920),
     max_file_size_mb=5.0,
-    supported_formats=['JPEG', 'PNG'],
+    supported_formats=_FMT_JPEG_PNG,
     max_text_length=None,
     platform_color='#FFFC00',
     api_type='webview',
@@ -94,7 +125,7 @@ ONLYFANS_SPECS = PlatformSpecs(
     platform_name='OnlyFans',
     max_image_dimensions=(4096, 4096),
     max_file_size_mb=50.0,
-    supported_formats=['JPEG', 'PNG', 'WEBP'],
+    supported_formats=_FMT_JPEG_PNG_WEBP,
     max_text_length=1000,
     platform_color='#00AFF0',
     api_type='webview',
@@ -108,7 +139,7 @@ FANSLY_SPECS = PlatformSpecs(
     platform_name='Fansly',
     max_image_dimensions=(4096, 4096),
     max_file_size_mb=50.0,
-    supported_formats=['JPEG', 'PNG', 'WEBP'],
+    supported_formats=_FMT_JPEG_PNG_WEBP,
     max_text_length=3000,
     platform_color='#0FABE5',
     api_type='webview',
@@ -122,7 +153,7 @@ FETLIFE_SPECS = PlatformSpecs(
     platform_name='FetLife',
     max_image_dimensions=(4096, 4096),
     max_file_size_mb=20.0,
-    supported_formats=['JPEG', 'PNG'],
+    supported_formats=_FMT_JPEG_PNG,
     max_text_length=None,
     platform_color='#D4001A',
     api_type='webview',
@@ -142,7 +173,7 @@ PLATFORM_SPECS_MAP: dict[str, PlatformSpecs] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class PostResult:
     """Result of a post attempt."""
 
@@ -152,12 +183,20 @@ class PostResult:
     error_code: str | None = None
     error_message: str | None = None
     raw_response: dict | None = None
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp_ns: int = field(default_factory=time.time_ns)
     account_id: str | None = None
     profile_name: str | None = None
     url_captured: bool = False
     user_confirmed: bool = False
 
+    @property
+    def timestamp(self) -> str:
+        """Local ISO-8601 time of the attempt, formatted on access."""
+        ns = self.timestamp_ns
+        return (
+            datetime.fromtimestamp(ns // 10**9).replace(microsecond=ns // 1000 % 10**6).isoformat()
+        )
+
 
 ERROR_CODES = {
     # Authentication (AUTH)
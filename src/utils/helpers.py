@@ -2,11 +2,26 @@
 
 import os
 import platform
+import re
 import sys
 import uuid
+from functools import cache
 from pathlib import Path
 from typing import TypedDict
 
+_WIN_BUILD_RE = re.compile(r'^\d+\.\d+\.(\d+)(?:\.|$)')
+
+# Directories already created (or confirmed to exist) by this process.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process and return it."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
 
 def get_app_data_dir() -> Path:
     """Return the application data directory, creating it if needed."""
@@ -14,38 +29,39 @@ def get_app_data_dir() -> Path:
         base = Path(os.environ.get('APPDATA', Path.home() / 'AppData' / 'Roaming'))
     else:
         base = Path.home() / '.config'
-    app_dir = base / 'GaleFling'
-    app_dir.mkdir(parents=True, exist_ok=True)
-    return app_dir
+    return _ensure_dir(base / 'GaleFling')
 
 
 def get_auth_dir() -> Path:
     """Return the auth directory, creating it if needed."""
-    auth_dir = get_app_data_dir() / 'auth'
-    auth_dir.mkdir(parents=True, exist_ok=True)
-    return auth_dir
+    return _ensure_dir(get_app_data_dir() / 'auth')
 
 
 def get_drafts_dir() -> Path:
     """Return the drafts directory, creating it if needed."""
-    drafts_dir = get_app_data_dir() / 'drafts'
-    drafts_dir.mkdir(parents=True, exist_ok=True)
-    return drafts_dir
+    return _ensure_dir(get_app_data_dir() / 'drafts')
 
 
 def get_logs_dir() -> Path:
     """Return the logs directory, creating it if needed."""
-    logs_dir = get_app_data_dir() / 'logs'
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    (logs_dir / 'screenshots').mkdir(exist_ok=True)
+    logs_dir = _ensure_dir(get_app_data_dir() / 'logs')
+    _ensure_dir(logs_dir / 'screenshots')
     return logs_dir
 
 
+def get_downloads_dir() -> Path:
+    """Return the user's Downloads directory, creating it if needed."""
+    return _ensure_dir(Path.home() / 'Downloads')
+
+
+@cache
 def get_installation_id() -> str:
-    """Return a persistent unique ID for this installation."""
+    """Return a persistent unique ID for this installation (read once per process)."""
     id_file = get_app_data_dir() / 'installation_id'
-    if id_file.exists():
+    try:
         return id_file.read_text().strip()
+    except FileNotFoundError:
+        pass
     install_id = str(uuid.uuid4())
     id_file.write_text(install_id)
     return install_id
@@ -79,11 +95,8 @@ def get_os_info() -> OsInfo:
         win_release, win_version, win_csd, _ = platform.win32_ver()
         release = win_release or platform.release()
         version = win_version or platform.version()
-        build = None
-        if version:
-            parts = version.split('.')
-            if len(parts) >= 3 and parts[2].isdigit():
-                build = int(parts[2])
+        match = _WIN_BUILD_RE.match(version) if version else None
+        build = int(match.group(1)) if match else None
         if release == '10' and build and build >= 22000:
             release = '11'
         csd = win_csd or 'SP0'
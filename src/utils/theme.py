@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import sys
+from functools import cache
+from typing import TYPE_CHECKING
 
-from PyQt6.QtGui import QColor, QPalette
-from PyQt6.QtWidgets import QApplication, QWidget
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QPalette
+    from PyQt6.QtWidgets import QApplication, QWidget
+
+_FIXED_THEME_MODES = {'dark': 'dark', 'light': 'light'}
+
+# Standard (light) palettes keyed by style name, filled on first use.
+_STANDARD_PALETTES: dict[str, QPalette] = {}
 
 
 def windows_prefers_dark() -> bool:
@@ -25,14 +33,14 @@ def windows_prefers_dark() -> bool:
 
 
 def resolve_theme_mode(mode: str) -> str:
-    if mode == 'dark':
-        return 'dark'
-    if mode == 'light':
-        return 'light'
-    return 'dark' if windows_prefers_dark() else 'light'
+    return _FIXED_THEME_MODES.get(mode) or ('dark' if windows_prefers_dark() else 'light')
 
 
-def _apply_dark_palette(app: QApplication):
+@cache
+def _get_dark_palette() -> QPalette:
+    """Build the dark palette once; callers share the cached instance."""
+    from PyQt6.QtGui import QColor, QPalette
+
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
     palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
@@ -47,9 +55,41 @@ def _apply_dark_palette(app: QApplication):
     palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
     palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
     palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
+    return palette
+
+
+def _apply_dark_palette(app: QApplication):
+    app.setPalette(_get_dark_palette())
+
+
+def _apply_standard_palette(app: QApplication):
+    style = app.style()
+    if style is None:
+        from PyQt6.QtGui import QPalette
+
+        app.setPalette(QPalette())
+        return
+    style_name = style.objectName() or 'default'
+    palette = _STANDARD_PALETTES.get(style_name)
+    if palette is None:
+        palette = style.standardPalette()
+        _STANDARD_PALETTES[style_name] = palette
     app.setPalette(palette)
 
 
+@cache
+def _get_dwm_set_window_attribute():
+    """Load dwmapi once and return its prototyped DwmSetWindowAttribute."""
+    import ctypes
+    from ctypes import wintypes
+
+    dwmapi = ctypes.WinDLL('dwmapi', use_last_error=True)
+    func = dwmapi.DwmSetWindowAttribute
+    func.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+    func.restype = ctypes.c_long
+    return func
+
+
 def set_windows_dark_title_bar(window: QWidget, enabled: bool) -> None:
     if sys.platform != 'win32':
         return
@@ -57,6 +97,7 @@ def set_windows_dark_title_bar(window: QWidget, enabled: bool) -> None:
         import ctypes
         from ctypes import wintypes
 
+        dwm_set_window_attribute = _get_dwm_set_window_attribute()
         hwnd = int(window.winId())
 
         # Attribute values vary by Windows build. Try 20 first, then 19.
@@ -64,14 +105,15 @@ def set_windows_dark_title_bar(window: QWidget, enabled: bool) -> None:
         dwmwa_use_immersive_dark_mode_before_20h1 = 19
         value = wintypes.BOOL(1 if enabled else 0)
 
-        dwmapi = ctypes.WinDLL('dwmapi', use_last_error=True)
         for attr in (dwmwa_use_immersive_dark_mode, dwmwa_use_immersive_dark_mode_before_20h1):
-            dwmapi.DwmSetWindowAttribute(
-                wintypes.HWND(hwnd),
-                wintypes.DWORD(attr),
+            result = dwm_set_window_attribute(
+                hwnd,
+                attr,
                 ctypes.byref(value),
                 ctypes.sizeof(value),
             )
+            if result == 0:  # S_OK
+                break
     except Exception:
         # Best-effort only. If this fails, the title bar stays default.
         return
@@ -81,15 +123,14 @@ def apply_theme(app: QApplication, window: QWidget | None, mode: str) -> str:
     resolved = resolve_theme_mode(mode)
     use_dark = resolved == 'dark'
 
-    app.setStyle('Fusion')
+    # Re-setting the style repolishes every widget; dialogs call this on open.
+    style = app.style()
+    if style is None or style.objectName() != 'fusion':
+        app.setStyle('Fusion')
     if use_dark:
         _apply_dark_palette(app)
     else:
-        style = app.style()
-        if style is not None:
-            app.setPalette(style.standardPalette())
-        else:
-            app.setPalette(QPalette())
+        _apply_standard_palette(app)
 
     if window is not None:
         set_windows_dark_title_bar(window, use_dark)
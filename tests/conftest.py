@@ -1,15 +1,156 @@
 import os
+import re
 import sys
+import types
+
+import pytest
+
+# The log-upload Lambda creates its SES client at import time. Stub boto3 before
+# collection so no test pays for (or depends on) the real SDK; tests swap
+# `lambda_function.ses` for a fake.
+sys.modules.setdefault('boto3', types.SimpleNamespace(client=lambda _name: object()))
 
 
 def pytest_configure():
-    if (
-        os.environ.get('GITHUB_ACTIONS') == 'true'
-        or os.environ.get('CI') == 'true'
-        or (
-            sys.platform == 'linux'
-            and not os.environ.get('DISPLAY')
-            and not os.environ.get('WAYLAND_DISPLAY')
-        )
-    ):
-        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env = os.environ
+    is_ci = env.get('GITHUB_ACTIONS') == 'true' or env.get('CI') == 'true'
+    is_headless_linux = (
+        sys.platform == 'linux' and not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY')
+    )
+    if is_ci or is_headless_linux:
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(autouse=True)
+def _reset_helpers_state():
+    """Drop per-process caches in src.utils.helpers so tests never see another test's paths."""
+    from src.utils import helpers
+
+    helpers.get_installation_id.cache_clear()
+    helpers._ENSURED_DIRS.clear()
+
+
+# ── Shared image templates ──────────────────────────────────────────
+# Encoded once per session; per-test fixtures copy them into their tmp_path.
+# The large templates only exercise the resize path, so they are encoded at
+# low quality without optimization to keep libjpeg work down.
+
+
+def _save_template(tmp_path_factory, filename, mode, size, color, fmt, **save_kwargs):
+    from PIL import Image
+
+    path = tmp_path_factory.mktemp('imgs') / filename
+    Image.new(mode, size, color=color).save(path, fmt, **save_kwargs)
+    return path
+
+
+@pytest.fixture(scope='session')
+def small_jpeg_template(tmp_path_factory):
+    return _save_template(tmp_path_factory, 'small.jpg', 'RGB', (100, 100), 'red', 'JPEG')
+
+
+@pytest.fixture(scope='session')
+def large_jpeg_template(tmp_path_factory):
+    return _save_template(
+        tmp_path_factory,
+        'large.jpg',
+        'RGB',
+        (5000, 5000),
+        'blue',
+        'JPEG',
+        quality=50,
+        optimize=False,
+    )
+
+
+@pytest.fixture(scope='session')
+def rgba_png_template(tmp_path_factory):
+    return _save_template(
+        tmp_path_factory, 'alpha.png', 'RGBA', (200, 200), (255, 0, 0, 128), 'PNG'
+    )
+
+
+@pytest.fixture(scope='session')
+def large_image_template(tmp_path_factory):
+    return _save_template(
+        tmp_path_factory,
+        'large.jpg',
+        'RGB',
+        (3000, 3000),
+        'blue',
+        'JPEG',
+        quality=50,
+        optimize=False,
+    )
+
+
+@pytest.fixture(scope='session')
+def vertical_image_template(tmp_path_factory):
+    return _save_template(tmp_path_factory, 'vertical.jpg', 'RGB', (1080, 1920), 'green', 'JPEG')
+
+
+@pytest.fixture(scope='session')
+def small_webp_template(tmp_path_factory):
+    return _save_template(tmp_path_factory, 'small.webp', 'RGB', (10, 10), 'red', 'WEBP')
+
+
+def assert_fits(size: tuple[int, int], bounds: tuple[int, int]) -> None:
+    """Assert an image size lies within a platform's (max_w, max_h) bounds."""
+    assert size[0] <= bounds[0] and size[1] <= bounds[1], f'{size} exceeds {bounds}'
+
+
+# ── Placeholder files ───────────────────────────────────────────────
+# Shared read-only stand-ins for tests that only need an existing path.
+# Tests whose code under test deletes the file keep writing into tmp_path.
+
+
+@pytest.fixture(scope='session')
+def fake_image(tmp_path_factory):
+    path = tmp_path_factory.mktemp('placeholders') / 'image.png'
+    path.write_bytes(b'fake')
+    return path
+
+
+@pytest.fixture(scope='session')
+def fake_processed_image(tmp_path_factory):
+    path = tmp_path_factory.mktemp('placeholders') / 'processed.png'
+    path.write_bytes(b'processed')
+    return path
+
+
+# ── Managers backed by a per-test settings dir ──────────────────────
+# One tmp_path_factory root per module, one plain subdirectory per test, so
+# the managers stay isolated without pytest's numbered-dir setup each time.
+
+
+@pytest.fixture(scope='module')
+def _settings_root(tmp_path_factory):
+    return tmp_path_factory.mktemp('settings')
+
+
+@pytest.fixture
+def settings_dir(_settings_root, request):
+    # Parametrize ids may contain path separators or characters Windows rejects.
+    path = _settings_root / re.sub(r'\W', '_', request.node.name)
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def tmp_config(settings_dir, monkeypatch):
+    """ConfigManager whose config.json lives in this test's settings_dir."""
+    import src.core.config_manager as config_manager
+
+    monkeypatch.setattr(config_manager, 'get_app_data_dir', lambda: settings_dir)
+    return config_manager.ConfigManager()
+
+
+@pytest.fixture
+def tmp_auth(settings_dir, monkeypatch):
+    """AuthManager whose credentials and accounts config live under this test's settings_dir."""
+    import src.core.auth_manager as auth_manager
+
+    monkeypatch.setattr(auth_manager, 'get_auth_dir', lambda: settings_dir / 'auth')
+    monkeypatch.setattr(auth_manager, 'get_app_data_dir', lambda: settings_dir)
+    monkeypatch.setattr(auth_manager.AuthManager, '_find_dev_auth_dir', lambda self: None)
+    return auth_manager.AuthManager()
@@ -14,6 +14,15 @@ def fresh_auth_dir(tmp_path, request):
     return auth_dir
 
 
+@pytest.fixture
+def isolated_auth_dir(fresh_auth_dir, monkeypatch):
+    """Point AuthManager's credential and accounts config paths at fresh_auth_dir."""
+    monkeypatch.setattr('src.core.auth_manager.get_auth_dir', lambda: fresh_auth_dir)
+    monkeypatch.setattr('src.core.auth_manager.get_app_data_dir', lambda: fresh_auth_dir)
+    monkeypatch.setattr(AuthManager, '_find_dev_auth_dir', lambda self: None)
+    return fresh_auth_dir
+
+
 def test_add_and_get_accounts(fresh_auth_dir, monkeypatch):
     """Test adding and retrieving accounts."""
     monkeypatch.setattr('src.core.auth_manager.get_auth_dir', lambda: fresh_auth_dir)
@@ -176,3 +185,55 @@ def test_accounts_persisted_to_file(fresh_auth_dir, monkeypatch):
     accounts = manager2.get_accounts()
     assert len(accounts) == 1
     assert accounts[0].account_id == 'fetlife_1'
+
+
+def test_add_account_updates_platform_index(isolated_auth_dir):
+    """Test that re-adding an account under a new platform moves it in the index."""
+    manager = AuthManager()
+
+    manager.add_account(
+        AccountConfig(platform_id='twitter', account_id='shared_1', profile_name='a')
+    )
+    manager.add_account(
+        AccountConfig(platform_id='bluesky', account_id='shared_1', profile_name='b')
+    )
+
+    assert manager.get_accounts_for_platform('twitter') == []
+    bluesky_accounts = manager.get_accounts_for_platform('bluesky')
+    assert len(bluesky_accounts) == 1
+    assert bluesky_accounts[0].profile_name == 'b'
+
+    manager.remove_account('shared_1')
+    assert manager.get_accounts_for_platform('bluesky') == []
+    assert manager.get_accounts() == []
+
+
+def test_remove_account_drops_duplicate_entries(isolated_auth_dir):
+    """Test that removing an account drops every entry sharing its ID."""
+    (isolated_auth_dir / 'accounts_config.json').write_text(
+        '{"accounts": ['
+        '{"platform_id": "twitter", "account_id": "twitter_1"}, '
+        '{"platform_id": "twitter", "account_id": "twitter_1"}]}'
+    )
+    manager = AuthManager()
+
+    manager.remove_account('twitter_1')
+
+    assert manager.get_accounts() == []
+    assert manager.get_accounts_for_platform('twitter') == []
+    assert manager.get_account('twitter_1') is None
+
+
+def test_loaded_platform_ids_are_interned(isolated_auth_dir):
+    """Test that platform IDs read from accounts_config.json share the map's key objects."""
+    from src.utils.constants import PLATFORM_SPECS_MAP
+
+    (isolated_auth_dir / 'accounts_config.json').write_text(
+        '{"accounts": [{"platform_id": "fansly", "account_id": "fansly_1"}]}'
+    )
+
+    account = AuthManager().get_account('fansly_1')
+
+    assert account is not None
+    key = next(k for k in PLATFORM_SPECS_MAP if k == 'fansly')
+    assert account.platform_id is key
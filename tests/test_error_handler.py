@@ -11,14 +11,12 @@ from src.utils.constants import ERROR_CODES, USER_FRIENDLY_MESSAGES, PostResult
 
 class TestErrorCodes:
     def test_all_codes_have_messages(self):
-        for code in ERROR_CODES:
-            assert code in USER_FRIENDLY_MESSAGES, (
-                f'Error code {code} missing user-friendly message'
-            )
+        missing = ERROR_CODES.keys() - USER_FRIENDLY_MESSAGES.keys()
+        assert not missing, f'Error codes missing user-friendly messages: {sorted(missing)}'
 
     def test_all_friendly_messages_have_codes(self):
-        for code in USER_FRIENDLY_MESSAGES:
-            assert code in ERROR_CODES, f'User message for {code} has no matching error code'
+        orphaned = USER_FRIENDLY_MESSAGES.keys() - ERROR_CODES.keys()
+        assert not orphaned, f'User messages with no matching error code: {sorted(orphaned)}'
 
     def test_get_error_message_known(self):
         msg = get_error_message('TW-AUTH-INVALID')
@@ -76,3 +74,20 @@ class TestFormatErrorDetails:
         )
         text = format_error_details(result)
         assert 'GaleFling' in text
+
+    def test_format_includes_iso_timestamp(self):
+        result = PostResult(
+            success=False,
+            platform='Twitter',
+            error_code='POST-FAILED',
+            timestamp_ns=1_700_000_000_000_000_000,
+        )
+        text = format_error_details(result)
+        assert f'Timestamp: {result.timestamp}' in text
+        assert result.timestamp.startswith('2023-11-1')
+
+    def test_timestamp_keeps_exact_microseconds(self):
+        result = PostResult(
+            success=True, platform='Twitter', timestamp_ns=1_700_000_000_999_999_999
+        )
+        assert result.timestamp.endswith('.999999')
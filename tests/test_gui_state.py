@@ -1,7 +1,11 @@
+import pytest
+
 from src.gui.platform_selector import PlatformSelector
 from src.gui.post_composer import PostComposer
 from src.utils.constants import AccountConfig
 
+pytestmark = pytest.mark.qt
+
 
 def _sample_accounts():
     """Create sample accounts for testing."""
@@ -16,9 +20,38 @@ def _sample_accounts():
     ]
 
 
-def test_platform_selector_disables_checkboxes(qtbot):
-    selector = PlatformSelector()
-    qtbot.addWidget(selector)
+@pytest.fixture(scope='module')
+def _shared_composer(qapp):
+    """Build one PostComposer for the module; widget construction dominates these tests."""
+    widget = PostComposer()
+    yield widget
+    widget.close()
+    widget.deleteLater()
+
+
+@pytest.fixture(scope='module')
+def _shared_selector(qapp):
+    widget = PlatformSelector()
+    yield widget
+    widget.close()
+    widget.deleteLater()
+
+
+@pytest.fixture
+def composer(_shared_composer):
+    yield _shared_composer
+    _shared_composer.set_account_platform_map({})
+    _shared_composer.set_platform_state([], [])
+    _shared_composer.clear()
+
+
+@pytest.fixture
+def selector(_shared_selector):
+    yield _shared_selector
+    _shared_selector.set_accounts([])
+
+
+def test_platform_selector_disables_checkboxes(selector):
     selector.set_accounts(_sample_accounts())
 
     selector.set_platform_enabled('twitter_1', False)
@@ -36,12 +69,7 @@ def test_platform_selector_disables_checkboxes(qtbot):
     assert 'bluesky_alt' in selector.get_selected()
 
 
-def test_post_composer_counters_and_attach_button(qtbot):
-    composer = PostComposer()
-    qtbot.addWidget(composer)
-    composer.show()
-    qtbot.waitExposed(composer)
-
+def test_post_composer_counters_and_attach_button(composer):
     composer.set_account_platform_map(
         {
             'twitter_1': 'twitter',
@@ -62,20 +90,13 @@ def test_post_composer_counters_and_attach_button(qtbot):
     assert 'twitter' in composer._counter_labels
 
 
-def test_theme_label_styles_follow_palette(qtbot):
-    composer = PostComposer()
-    selector = PlatformSelector()
-    qtbot.addWidget(composer)
-    qtbot.addWidget(selector)
-
+def test_theme_label_styles_follow_palette(composer, selector):
     assert 'palette(text)' in composer._text_label.styleSheet()
     assert 'palette(text)' in composer._img_label.styleSheet()
     assert 'palette(text)' in selector._label.styleSheet()
 
 
-def test_platform_selector_usernames(qtbot):
-    selector = PlatformSelector()
-    qtbot.addWidget(selector)
+def test_platform_selector_usernames(selector):
     selector.set_accounts(_sample_accounts())
 
     selector.set_platform_username('twitter_1', 'jasmeralia')
@@ -95,10 +116,7 @@ def test_platform_selector_usernames(qtbot):
     assert selector.get_platform_label('bluesky_alt') == 'Bluesky (alt)'
 
 
-def test_preview_button_enabled_when_image_present(qtbot, tmp_path):
-    composer = PostComposer()
-    qtbot.addWidget(composer)
-
+def test_preview_button_enabled_when_image_present(composer, tmp_path):
     composer.set_platform_state(['twitter_1'], ['twitter_1'])
     assert not composer._preview_btn.isEnabled()
 
@@ -28,16 +28,35 @@ def test_get_app_data_dir_windows_uses_appdata(tmp_path, monkeypatch):
     assert app_dir.exists()
 
 
+def test_get_downloads_dir_under_home(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+
+    downloads_dir = helpers.get_downloads_dir()
+
+    assert downloads_dir == tmp_path / 'Downloads'
+    assert downloads_dir.exists()
+
+
 def test_get_installation_id_is_persistent(tmp_path, monkeypatch):
     monkeypatch.setattr(helpers, 'get_app_data_dir', lambda: tmp_path)
 
     first = helpers.get_installation_id()
+    helpers.get_installation_id.cache_clear()
     second = helpers.get_installation_id()
 
     assert first == second
     assert (tmp_path / 'installation_id').exists()
 
 
+def test_get_installation_id_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(helpers, 'get_app_data_dir', lambda: tmp_path)
+
+    first = helpers.get_installation_id()
+    (tmp_path / 'installation_id').unlink()
+
+    assert helpers.get_installation_id() == first
+
+
 def test_get_resource_path_non_frozen(tmp_path, monkeypatch):
     monkeypatch.setattr(sys, 'frozen', False, raising=False)
     base = Path(helpers.__file__).resolve().parent.parent.parent
@@ -80,3 +99,13 @@ def test_get_os_info_non_windows(monkeypatch):
     assert info['name'] == 'Linux'
     assert info['release'] == '6.1'
     assert info['platform'] == 'Linux-6.1'
+
+
+def test_get_os_info_windows_10_build(monkeypatch):
+    monkeypatch.setattr(sys, 'platform', 'win32')
+    monkeypatch.setattr(helpers.platform, 'win32_ver', lambda: ('10', '10.0.19045', '', ''))
+
+    info = helpers.get_os_info()
+
+    assert info['release'] == '10'
+    assert info['platform'] == 'Windows-10-10.0.19045-SP0'
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from PIL import Image
 
 from src.gui.image_preview_tabs import ImagePreviewDialog, ImagePreviewTab, _format_size
-from src.utils.constants import TWITTER_SPECS
+
+pytestmark = pytest.mark.qt
 
 
 def _write_image(path: Path, size=(10, 10), color=(255, 0, 0)) -> Path:
@@ -16,51 +18,69 @@ def _write_image(path: Path, size=(10, 10), color=(255, 0, 0)) -> Path:
     return path
 
 
+def _write_original_stub(path: Path) -> Path:
+    """Write a PNG signature only; originals are just stat'ed when previews are cached."""
+    path.write_bytes(b'\x89PNG\r\n\x1a\n')
+    return path
+
+
 def test_format_size():
     assert _format_size(10) == '10 B'
     assert _format_size(2048).endswith('KB')
     assert _format_size(5 * 1024 * 1024).endswith('MB')
 
 
-def test_cached_preview_tab_loads_cached_image(qtbot, tmp_path):
-    original = _write_image(tmp_path / 'original.png')
-    cached = _write_image(tmp_path / 'cached.png', size=(20, 20))
+@pytest.fixture(scope='class')
+def cached_images(tmp_path_factory):
+    base = tmp_path_factory.mktemp('preview')
+    return {
+        'original': _write_original_stub(base / 'original.png'),
+        'twitter': _write_image(base / 'tw.png', size=(30, 30)),
+        'bluesky': _write_image(base / 'bs.png', size=(40, 40)),
+    }
 
-    tab = ImagePreviewTab(original, TWITTER_SPECS, cached_path=cached)
-    qtbot.addWidget(tab)
 
-    tab.load_preview()
+@pytest.fixture(scope='class')
+def cached_dialog(qapp, cached_images):
+    """Build one cached-preview dialog per class; widget construction dominates these tests."""
+    dialog = ImagePreviewDialog(
+        cached_images['original'],
+        ['twitter', 'bluesky'],
+        existing_paths={
+            'twitter': cached_images['twitter'],
+            'bluesky': cached_images['bluesky'],
+        },
+    )
+    yield dialog
+    dialog.close()
+    dialog.deleteLater()
 
-    assert tab.get_processed_path() == cached
-    assert tab._progress.value() == 100
-    assert 'Cached preview' in tab._status_label.text()
-    assert 'Cached' in tab._details_label.text()
 
-    pixmap = tab._preview_label.pixmap()
-    assert pixmap is not None
-    assert pixmap.width() > 0
+class TestCachedPreviewDialog:
+    def test_cached_preview_tab_loads_cached_image(self, cached_dialog, cached_images):
+        tab = cached_dialog._tabs['twitter']
+        assert isinstance(tab, ImagePreviewTab)
 
+        tab.load_preview()
 
-def test_preview_dialog_with_cached_paths_enables_ok(qtbot, tmp_path):
-    original = _write_image(tmp_path / 'original.png')
-    cached_tw = _write_image(tmp_path / 'tw.png', size=(30, 30))
-    cached_bs = _write_image(tmp_path / 'bs.png', size=(40, 40))
+        assert tab.get_processed_path() == cached_images['twitter']
+        assert tab._progress.value() == 100
+        assert 'Cached preview' in tab._status_label.text()
+        assert 'Cached' in tab._details_label.text()
 
-    dialog = ImagePreviewDialog(
-        original,
-        ['twitter', 'bluesky'],
-        existing_paths={'twitter': cached_tw, 'bluesky': cached_bs},
-    )
-    qtbot.addWidget(dialog)
+        pixmap = tab._preview_label.pixmap()
+        assert pixmap is not None
+        assert pixmap.width() > 0
 
-    assert dialog._ok_btn.isEnabled()
-    paths = dialog.get_processed_paths()
-    assert paths['twitter'] == cached_tw
-    assert paths['bluesky'] == cached_bs
+    def test_preview_dialog_with_cached_paths_enables_ok(self, cached_dialog, cached_images):
+        assert cached_dialog._ok_btn.isEnabled()
+        paths = cached_dialog.get_processed_paths()
+        assert paths['twitter'] == cached_images['twitter']
+        assert paths['bluesky'] == cached_images['bluesky']
 
 
 def test_preview_dialog_without_platforms_enables_ok(qtbot, tmp_path):
-    original = _write_image(tmp_path / 'original.png')
+    original = _write_original_stub(tmp_path / 'original.png')
 
     dialog = ImagePreviewDialog(original, [])
     qtbot.addWidget(dialog)
@@ -1,5 +1,8 @@
 """Tests for image processing."""
 
+import shutil
+from pathlib import Path
+
 import pytest
 from PIL import Image
 
@@ -9,33 +12,25 @@ from src.core.image_processor import (
     validate_image,
 )
 from src.utils.constants import BLUESKY_SPECS, TWITTER_SPECS
+from tests.conftest import assert_fits
 
 
 @pytest.fixture
-def small_jpeg(tmp_path):
+def small_jpeg(small_jpeg_template, tmp_path):
     """Create a small JPEG test image."""
-    img = Image.new('RGB', (100, 100), color='red')
-    path = tmp_path / 'small.jpg'
-    img.save(path, 'JPEG')
-    return path
+    return Path(shutil.copy(small_jpeg_template, tmp_path))
 
 
 @pytest.fixture
-def large_jpeg(tmp_path):
+def large_jpeg(large_jpeg_template, tmp_path):
     """Create a large JPEG test image (5000x5000)."""
-    img = Image.new('RGB', (5000, 5000), color='blue')
-    path = tmp_path / 'large.jpg'
-    img.save(path, 'JPEG', quality=95)
-    return path
+    return Path(shutil.copy(large_jpeg_template, tmp_path))
 
 
 @pytest.fixture
-def rgba_png(tmp_path):
+def rgba_png(rgba_png_template, tmp_path):
     """Create an RGBA PNG test image."""
-    img = Image.new('RGBA', (200, 200), color=(255, 0, 0, 128))
-    path = tmp_path / 'alpha.png'
-    img.save(path, 'PNG')
-    return path
+    return Path(shutil.copy(rgba_png_template, tmp_path))
 
 
 class TestValidateImage:
@@ -57,24 +52,21 @@ class TestProcessImage:
         result = process_image(small_jpeg, TWITTER_SPECS)
         assert result.meets_requirements
         assert result.path.exists()
-        assert result.processed_size[0] <= TWITTER_SPECS.max_image_dimensions[0]
+        assert_fits(result.processed_size, TWITTER_SPECS.max_image_dimensions)
 
     def test_large_image_resized_for_twitter(self, large_jpeg):
         result = process_image(large_jpeg, TWITTER_SPECS)
         assert result.meets_requirements
-        assert result.processed_size[0] <= TWITTER_SPECS.max_image_dimensions[0]
-        assert result.processed_size[1] <= TWITTER_SPECS.max_image_dimensions[1]
+        assert_fits(result.processed_size, TWITTER_SPECS.max_image_dimensions)
 
     def test_large_image_resized_for_bluesky(self, large_jpeg):
         result = process_image(large_jpeg, BLUESKY_SPECS)
-        assert result.processed_size[0] <= BLUESKY_SPECS.max_image_dimensions[0]
-        assert result.processed_size[1] <= BLUESKY_SPECS.max_image_dimensions[1]
+        assert_fits(result.processed_size, BLUESKY_SPECS.max_image_dimensions)
 
     def test_rgba_converted_to_rgb(self, rgba_png):
         result = process_image(rgba_png, TWITTER_SPECS)
         assert result.meets_requirements
-        processed_img = Image.open(result.path)
-        assert processed_img.mode == 'RGB'
+        assert result.mode == 'RGB'
 
     def test_aspect_ratio_preserved(self, tmp_path):
         img = Image.new('RGB', (4000, 2000), color='green')
@@ -93,9 +85,9 @@ class TestGenerateThumbnail:
         thumb = generate_thumbnail(small_jpeg, max_size=50)
         assert thumb is not None
         assert thumb.exists()
-        img = Image.open(thumb)
-        assert img.size[0] <= 50
-        assert img.size[1] <= 50
+        with Image.open(thumb, formats=['PNG']) as img:
+            assert img.size[0] <= 50
+            assert img.size[1] <= 50
 
     def test_returns_none_for_invalid(self, tmp_path):
         bad = tmp_path / 'bad.jpg'
@@ -1,7 +1,9 @@
 """Tests for image processing with Phase 1 platform specs."""
 
+import shutil
+from pathlib import Path
+
 import pytest
-from PIL import Image
 
 from src.core.image_processor import process_image, validate_image
 from src.utils.constants import (
@@ -11,84 +13,55 @@ from src.utils.constants import (
     ONLYFANS_SPECS,
     SNAPCHAT_SPECS,
 )
+from tests.conftest import assert_fits
 
 
 @pytest.fixture
-def large_image(tmp_path):
+def large_image(large_image_template, tmp_path):
     """Create a large test image (3000x3000)."""
-    img = Image.new('RGB', (3000, 3000), color='blue')
-    path = tmp_path / 'large.jpg'
-    img.save(path, 'JPEG', quality=95)
-    return path
+    return Path(shutil.copy(large_image_template, tmp_path))
 
 
 @pytest.fixture
-def vertical_image(tmp_path):
+def vertical_image(vertical_image_template, tmp_path):
     """Create a vertical test image for Snapchat (1080x1920)."""
-    img = Image.new('RGB', (1080, 1920), color='green')
-    path = tmp_path / 'vertical.jpg'
-    img.save(path, 'JPEG')
-    return path
-
-
-def test_instagram_specs(large_image):
-    """Test image processing for Instagram specs."""
-    result = process_image(large_image, INSTAGRAM_SPECS)
-    assert result.meets_requirements
-    assert result.processed_size[0] <= INSTAGRAM_SPECS.max_image_dimensions[0]
-    assert result.processed_size[1] <= INSTAGRAM_SPECS.max_image_dimensions[1]
-
-
-def test_snapchat_specs_vertical(vertical_image):
-    """Test Snapchat specs with vertical image."""
-    result = process_image(vertical_image, SNAPCHAT_SPECS)
+    return Path(shutil.copy(vertical_image_template, tmp_path))
+
+
+@pytest.mark.parametrize(
+    ('specs', 'image_fixture'),
+    [
+        (INSTAGRAM_SPECS, 'large_image'),
+        (SNAPCHAT_SPECS, 'vertical_image'),
+        (ONLYFANS_SPECS, 'large_image'),
+        (FANSLY_SPECS, 'large_image'),
+        (FETLIFE_SPECS, 'large_image'),
+    ],
+    ids=['instagram', 'snapchat', 'onlyfans', 'fansly', 'fetlife'],
+)
+def test_platform_specs(specs, image_fixture, request):
+    """Test image processing stays within each platform's dimension limits."""
+    result = process_image(request.getfixturevalue(image_fixture), specs)
     assert result.meets_requirements
-    assert result.processed_size[0] <= SNAPCHAT_SPECS.max_image_dimensions[0]
-    assert result.processed_size[1] <= SNAPCHAT_SPECS.max_image_dimensions[1]
+    assert_fits(result.processed_size, specs.max_image_dimensions)
 
 
-def test_onlyfans_specs(large_image):
+def test_onlyfans_specs_passthrough(large_image):
     """Test OnlyFans specs (larger size limits)."""
     result = process_image(large_image, ONLYFANS_SPECS)
-    assert result.meets_requirements
     # OnlyFans allows 4096x4096, so 3000x3000 should pass through
-    assert result.processed_size[0] == 3000
-    assert result.processed_size[1] == 3000
+    assert result.processed_size == (3000, 3000)
 
 
-def test_fansly_specs(large_image):
-    """Test Fansly specs (similar to OnlyFans)."""
-    result = process_image(large_image, FANSLY_SPECS)
-    assert result.meets_requirements
-    assert result.processed_size[0] <= FANSLY_SPECS.max_image_dimensions[0]
-    assert result.processed_size[1] <= FANSLY_SPECS.max_image_dimensions[1]
-
-
-def test_fetlife_specs(large_image):
-    """Test FetLife specs."""
-    result = process_image(large_image, FETLIFE_SPECS)
-    assert result.meets_requirements
-    assert result.processed_size[0] <= FETLIFE_SPECS.max_image_dimensions[0]
-    assert result.processed_size[1] <= FETLIFE_SPECS.max_image_dimensions[1]
-
-
-def test_instagram_validation_webp_rejected(tmp_path):
+def test_instagram_validation_webp_rejected(small_webp_template):
     """Test that Instagram rejects WEBP format."""
-    img = Image.new('RGB', (100, 100), color='red')
-    path = tmp_path / 'test.webp'
-    img.save(path, 'WEBP')
-
-    error = validate_image(path, INSTAGRAM_SPECS)
+    error = validate_image(small_webp_template, INSTAGRAM_SPECS)
     assert error == 'IMG-INVALID-FORMAT'
 
 
-def test_onlyfans_accepts_webp(tmp_path):
+def test_onlyfans_accepts_webp(small_webp_template):
     """Test that OnlyFans accepts WEBP format."""
-    img = Image.new('RGB', (100, 100), color='red')
-    path = tmp_path / 'test.webp'
-    img.save(path, 'WEBP')
-
-    error = validate_image(path, ONLYFANS_SPECS)
+    error = validate_image(small_webp_template, ONLYFANS_SPECS)
     assert error is None
 
 
@@ -25,6 +25,16 @@ def _make_platform(auth=None, **kwargs):
     return InstagramPlatform(auth or _FakeAuth(), **kwargs)
 
 
+def _json_response(status_code: int, payload: dict | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = payload or {}
+    return resp
+
+
+_IMAGE_URL_PAYLOAD = {'images': [{'source': 'https://scontent.example.com/photo.jpg'}]}
+
+
 def test_instagram_get_platform_name():
     p = _make_platform(profile_name='rinthemodel')
     assert p.get_platform_name() == 'Instagram (rinthemodel)'
@@ -52,10 +62,7 @@ def test_instagram_authenticate_missing_creds():
 
 @patch('src.platforms.instagram.requests')
 def test_instagram_authenticate_success(mock_requests):
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.json.return_value = {'username': 'rinthemodel'}
-    mock_requests.get.return_value = mock_resp
+    mock_requests.get.return_value = _json_response(200, {'username': 'rinthemodel'})
 
     p = _make_platform()
     success, error = p.authenticate()
@@ -65,9 +72,7 @@ def test_instagram_authenticate_success(mock_requests):
 
 @patch('src.platforms.instagram.requests')
 def test_instagram_authenticate_expired(mock_requests):
-    mock_resp = MagicMock()
-    mock_resp.status_code = 401
-    mock_requests.get.return_value = mock_resp
+    mock_requests.get.return_value = _json_response(401)
 
     p = _make_platform()
     success, error = p.authenticate()
@@ -84,36 +89,15 @@ def test_instagram_post_no_image():
 
 @patch('src.platforms.instagram.requests')
 def test_instagram_post_success(mock_requests, tmp_path):
-    # Mock the upload photo call
-    upload_resp = MagicMock()
-    upload_resp.status_code = 200
-    upload_resp.json.return_value = {'id': 'photo123'}
-
-    # Mock the get image URL call
-    url_resp = MagicMock()
-    url_resp.status_code = 200
-    url_resp.json.return_value = {'images': [{'source': 'https://scontent.example.com/photo.jpg'}]}
-
-    # Mock the create container call
-    container_resp = MagicMock()
-    container_resp.status_code = 200
-    container_resp.json.return_value = {'id': 'container456'}
-    container_resp.raise_for_status = MagicMock()
-
-    # Mock the publish call
-    publish_resp = MagicMock()
-    publish_resp.status_code = 200
-    publish_resp.json.return_value = {'id': 'media789'}
-    publish_resp.raise_for_status = MagicMock()
-
-    # Mock the permalink call
-    permalink_resp = MagicMock()
-    permalink_resp.status_code = 200
-    permalink_resp.json.return_value = {'permalink': 'https://www.instagram.com/p/ABC123/'}
-
-    # Set up the mock to return different responses for each call
-    mock_requests.post.side_effect = [upload_resp, container_resp, publish_resp]
-    mock_requests.get.side_effect = [url_resp, permalink_resp]
+    mock_requests.post.side_effect = [
+        _json_response(200, {'id': 'photo123'}),  # upload photo
+        _json_response(200, {'id': 'container456'}),  # create container
+        _json_response(200, {'id': 'media789'}),  # publish
+    ]
+    mock_requests.get.side_effect = [
+        _json_response(200, _IMAGE_URL_PAYLOAD),  # image URL
+        _json_response(200, {'permalink': 'https://www.instagram.com/p/ABC123/'}),
+    ]
 
     image = tmp_path / 'test.jpg'
     image.write_bytes(b'\xff\xd8\xff\xe0')
@@ -129,21 +113,11 @@ def test_instagram_post_success(mock_requests, tmp_path):
 
 @patch('src.platforms.instagram.requests')
 def test_instagram_post_rate_limited(mock_requests, tmp_path):
-    # Upload succeeds
-    upload_resp = MagicMock()
-    upload_resp.status_code = 200
-    upload_resp.json.return_value = {'id': 'photo123'}
-
-    url_resp = MagicMock()
-    url_resp.status_code = 200
-    url_resp.json.return_value = {'images': [{'source': 'https://scontent.example.com/photo.jpg'}]}
-
-    # Container creation rate limited
-    container_resp = MagicMock()
-    container_resp.status_code = 429
-
-    mock_requests.post.side_effect = [upload_resp, container_resp]
-    mock_requests.get.return_value = url_resp
+    mock_requests.post.side_effect = [
+        _json_response(200, {'id': 'photo123'}),
+        _json_response(429),  # container creation rate limited
+    ]
+    mock_requests.get.return_value = _json_response(200, _IMAGE_URL_PAYLOAD)
 
     image = tmp_path / 'test.jpg'
     image.write_bytes(b'\xff\xd8\xff\xe0')
@@ -1,13 +1,10 @@
 """Tests for the log upload Lambda."""
 
 import json
-import sys
-import types
 
-fake_boto3 = types.SimpleNamespace(client=lambda _name: object())
-sys.modules.setdefault('boto3', fake_boto3)
+import pytest
 
-import infrastructure.lambda_function as lf  # noqa: E402
+import infrastructure.lambda_function as lf
 
 
 class FakeSES:
@@ -22,45 +19,59 @@ class FakeSES:
         self.raw_sent.append(kwargs)
 
 
+_BASE_EVENT = {'httpMethod': 'POST'}
+
+
 def _make_event(body: dict) -> dict:
-    return {
-        'httpMethod': 'POST',
-        'body': json.dumps(body),
+    return _BASE_EVENT | {'body': json.dumps(body)}
+
+
+# Encoded once at import; lambda_handler only reads the event.
+_EVENT_MISSING_NOTES = _make_event({'user_id': 'abc'})
+_EVENT_FULL_METADATA = _make_event(
+    {
+        'app_version': '0.2.13',
+        'error_code': 'POST-FAILED',
+        'user_id': 'abc',
+        'user_notes': 'Attached an image and clicked OK',
+        'hostname': 'storm-pc',
+        'username': 'morgan',
+        'os_version': '10.0.26100',
+        'os_platform': 'Windows-11-10.0.26100-SP0',
+        'log_files': [],
+        'screenshots': [],
+    }
+)
+_EVENT_WITH_ATTACHMENT = _make_event(
+    {
+        'app_version': '0.2.13',
+        'error_code': 'POST-FAILED',
+        'user_id': 'abc',
+        'user_notes': 'Attached an image and clicked OK',
+        'os_platform': 'Windows-11-10.0.26100-SP0',
+        'log_files': [{'filename': 'app.log', 'content': 'SGVsbG8='}],
+        'screenshots': [],
     }
+)
 
 
-def test_missing_user_notes_returns_400(monkeypatch):
-    fake_ses = FakeSES()
-    monkeypatch.setattr(lf, 'ses', fake_ses)
+@pytest.fixture
+def fake_ses(monkeypatch):
+    ses = FakeSES()
+    monkeypatch.setattr(lf, 'ses', ses)
+    return ses
 
-    event = _make_event({'user_id': 'abc'})
-    result = lf.lambda_handler(event, None)
+
+def test_missing_user_notes_returns_400(fake_ses):
+    result = lf.lambda_handler(_EVENT_MISSING_NOTES, None)
 
     assert result['statusCode'] == 400
     body = json.loads(result['body'])
     assert body['message'] == 'Missing required field: user_notes'
 
 
-def test_user_notes_in_metadata_and_email(monkeypatch):
-    fake_ses = FakeSES()
-    monkeypatch.setattr(lf, 'ses', fake_ses)
-
-    event = _make_event(
-        {
-            'app_version': '0.2.13',
-            'error_code': 'POST-FAILED',
-            'user_id': 'abc',
-            'user_notes': 'Attached an image and clicked OK',
-            'hostname': 'storm-pc',
-            'username': 'morgan',
-            'os_version': '10.0.26100',
-            'os_platform': 'Windows-11-10.0.26100-SP0',
-            'log_files': [],
-            'screenshots': [],
-        }
-    )
-
-    result = lf.lambda_handler(event, None)
+def test_user_notes_in_metadata_and_email(fake_ses):
+    result = lf.lambda_handler(_EVENT_FULL_METADATA, None)
     assert result['statusCode'] == 200
 
     assert fake_ses.sent
@@ -73,22 +84,7 @@ def test_user_notes_in_metadata_and_email(monkeypatch):
     assert 'OS Platform: Windows-11-10.0.26100-SP0' in email_body
 
 
-def test_attachments_use_raw_email(monkeypatch):
-    fake_ses = FakeSES()
-    monkeypatch.setattr(lf, 'ses', fake_ses)
-
-    event = _make_event(
-        {
-            'app_version': '0.2.13',
-            'error_code': 'POST-FAILED',
-            'user_id': 'abc',
-            'user_notes': 'Attached an image and clicked OK',
-            'os_platform': 'Windows-11-10.0.26100-SP0',
-            'log_files': [{'filename': 'app.log', 'content': 'SGVsbG8='}],
-            'screenshots': [],
-        }
-    )
-
-    result = lf.lambda_handler(event, None)
+def test_attachments_use_raw_email(fake_ses):
+    result = lf.lambda_handler(_EVENT_WITH_ATTACHMENT, None)
     assert result['statusCode'] == 200
     assert fake_ses.raw_sent
@@ -1,5 +1,9 @@
+import pytest
+
 from src.gui.log_submit_dialog import LogSubmitDialog
 
+pytestmark = pytest.mark.qt
+
 
 def test_log_submit_dialog_requires_notes(qtbot):
     dialog = LogSubmitDialog()
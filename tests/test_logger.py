@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
+import pytest
+
 import src.core.logger as logger
 
 
-def test_setup_logging_creates_log_file(tmp_path, monkeypatch):
-    monkeypatch.setattr(logger, 'get_logs_dir', lambda: tmp_path)
+@pytest.fixture(scope='module')
+def session_log(tmp_path_factory):
+    """Initialize logging once for the module against a shared temp logs dir."""
+    logs_dir = tmp_path_factory.mktemp('logs')
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(logger, 'get_logs_dir', lambda: logs_dir)
+        yield logs_dir, logger.setup_logging(debug_mode=False)
+
 
-    log = logger.setup_logging(debug_mode=False)
+def test_setup_logging_creates_log_file(session_log):
+    logs_dir, log = session_log
     path = logger.get_current_log_path()
 
     assert path is not None
     assert path.exists()
+    assert path.parent == logs_dir
     assert log.name == 'GaleFling'
 
 
-def test_reset_log_file_rotates(tmp_path, monkeypatch):
-    monkeypatch.setattr(logger, 'get_logs_dir', lambda: tmp_path)
-
-    logger.setup_logging(debug_mode=False)
+def test_reset_log_file_rotates(session_log):
     first_path = logger.get_current_log_path()
 
     logger.reset_log_file()
@@ -30,12 +37,9 @@ def test_reset_log_file_rotates(tmp_path, monkeypatch):
     assert second_path.exists()
 
 
-def test_log_error_writes_entry(tmp_path, monkeypatch):
-    monkeypatch.setattr(logger, 'get_logs_dir', lambda: tmp_path)
+def test_log_error_writes_entry(session_log, monkeypatch):
     monkeypatch.setattr(logger, 'capture_screenshot', lambda *_: None)
 
-    logger.setup_logging(debug_mode=False)
-
     logger.log_error('POST-FAILED', 'Twitter', details={'info': 'bad'})
 
     path = logger.get_current_log_path()
@@ -1,8 +1,16 @@
+import logging
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock
+
+import pytest
 from PyQt6.QtWidgets import QMessageBox
 
+from src.core.log_uploader import LogUploader
 from src.gui.main_window import MainWindow
 from src.utils.constants import AccountConfig
 
+pytestmark = pytest.mark.qt
+
 
 class DummyAuthManager:
     def __init__(self, twitter: bool, bluesky: bool, bluesky_alt: bool = False):
@@ -74,19 +82,21 @@ class DummyAuthManager:
         return [a for a in self.get_accounts() if a.platform_id == platform_id]
 
 
+@dataclass(slots=True)
 class DummyConfig:
-    def __init__(self, selected=None):
-        self.last_selected_platforms = selected or []
-        self.last_image_directory = ''
-        self.auto_save_draft = False
-        self.draft_interval = 30
-        self.auto_check_updates = False
-        self.allow_prerelease_updates = False
-        self.theme_mode = 'system'
-        self.window_geometry = {'x': 0, 'y': 0, 'width': 800, 'height': 600}
-        self.log_upload_endpoint = 'https://example.invalid'
-        self.log_upload_enabled = True
-        self.debug_mode = False
+    last_selected_platforms: list[str] = field(default_factory=list)
+    window_geometry: dict[str, int] = field(
+        default_factory=lambda: {'x': 0, 'y': 0, 'width': 800, 'height': 600}
+    )
+    last_image_directory: str = ''
+    auto_save_draft: bool = False
+    draft_interval: int = 30
+    auto_check_updates: bool = False
+    allow_prerelease_updates: bool = False
+    theme_mode: str = 'system'
+    log_upload_endpoint: str = 'https://example.invalid'
+    log_upload_enabled: bool = True
+    debug_mode: bool = False
 
     def save(self):
         return
@@ -100,6 +110,141 @@ class DummyMainWindow(MainWindow):
         return
 
 
+def _drop_instance_overrides(obj):
+    """Remove per-test monkeypatches like `window._send_logs = ...` from a shared widget."""
+    for name in [name for name in vars(obj) if callable(getattr(type(obj), name, None))]:
+        delattr(obj, name)
+
+
+def _reset_window(window, config=None, auth_manager=None):
+    _drop_instance_overrides(window)
+    _drop_instance_overrides(window._composer)
+    window._processed_images = {}
+    window._composer.set_text('')
+    window._composer.set_image_path(None)
+    window._pending_webview_platforms = []
+    window._pending_text = ''
+    window._pending_image_path = None
+    window.statusBar().clearMessage()
+    if config is not None:
+        window._config = config
+        window._log_uploader = LogUploader(config)
+    if auth_manager is not None:
+        window._auth_manager = auth_manager
+
+
+@pytest.fixture(scope='module')
+def _shared_main_window(qapp):
+    """Build one MainWindow for the module; widget construction dominates these tests."""
+    window = DummyMainWindow(DummyConfig(), DummyAuthManager(False, False))
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+@pytest.fixture
+def main_window_factory(_shared_main_window):
+    """Return a callable that rebinds the shared window to a fresh config/auth pair.
+
+    Tests that depend on construction-time state (menu logger, subclass hooks)
+    still build their own window.
+    """
+
+    def factory(config, auth_manager):
+        _reset_window(_shared_main_window, config, auth_manager)
+        _shared_main_window._refresh_platform_state()
+        return _shared_main_window
+
+    yield factory
+    _reset_window(_shared_main_window)
+
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Route MainWindow's get_logger() to a Logger-specced mock."""
+    logger = MagicMock(spec=logging.Logger)
+    monkeypatch.setattr('src.gui.main_window.get_logger', lambda: logger)
+    return logger
+
+
+class _NullSignal:
+    def connect(self, *_a, **_k):
+        return
+
+
+class DummyWorker:
+    """Stands in for PostWorker/UpdateDownloadWorker; never starts a thread."""
+
+    def __init__(self, *_args, **_kwargs):
+        self.progress = _NullSignal()
+        self.finished = _NullSignal()
+
+    def start(self):
+        return
+
+
+class DummyProgress:
+    def __init__(self, *_args, **_kwargs):
+        self.exec_called = False
+
+    def setWindowTitle(self, _title):  # noqa: N802
+        return
+
+    def setWindowModality(self, _mode):  # noqa: N802
+        return
+
+    def setMinimumDuration(self, _value):  # noqa: N802
+        return
+
+    def setAutoClose(self, _value):  # noqa: N802
+        return
+
+    def setAutoReset(self, _value):  # noqa: N802
+        return
+
+    def setValue(self, _value):  # noqa: N802
+        return
+
+    def exec(self):
+        self.exec_called = True
+        return 0
+
+
+class DummyMessageBox:
+    """Non-modal QMessageBox stand-in; exec() returns immediately."""
+
+    Icon = QMessageBox.Icon
+    StandardButton = QMessageBox.StandardButton
+    Ok = 0
+    Information = 1
+    Warning = 2
+    Question = 3
+    Yes = 4
+    No = 5
+    StandardButtons = int
+
+    def __init__(self, *_a, **_k):
+        return
+
+    def setWindowTitle(self, *_a, **_k):  # noqa: N802
+        return
+
+    def setText(self, *_a, **_k):  # noqa: N802
+        return
+
+    def setIcon(self, *_a, **_k):  # noqa: N802
+        return
+
+    def setStandardButtons(self, *_a, **_k):  # noqa: N802
+        return
+
+    def setDefaultButton(self, *_a, **_k):  # noqa: N802
+        return
+
+    def exec(self, *_a, **_k):
+        return 0
+
+
 def _find_menu_action(window, menu_text, action_text):
     for menu_action in window.menuBar().actions():
         if menu_action.text() != menu_text:
@@ -113,40 +258,41 @@ def _find_menu_action(window, menu_text, action_text):
     raise AssertionError(f'Action not found: {menu_text} > {action_text}')
 
 
-def test_main_window_no_credentials_disables_actions(qtbot):
-    window = DummyMainWindow(
-        DummyConfig(selected=['twitter_1', 'bluesky_1']), DummyAuthManager(False, False)
-    )
-    qtbot.addWidget(window)
-
-    assert window._platform_selector.get_enabled() == []
-    assert window._platform_selector.get_selected() == []
-    assert not window._post_btn.isEnabled()
-    assert not window._test_btn.isEnabled()
-    assert not window._composer._choose_btn.isEnabled()
-
-
-def test_menu_action_logging(qtbot, monkeypatch):
-    logged = []
-
-    class DummyLogger:
-        def info(self, message):
-            logged.append(message)
-
-    logger = DummyLogger()
-    monkeypatch.setattr('src.gui.main_window.get_logger', lambda: logger)
+@pytest.mark.parametrize(
+    ('selected', 'auth_flags', 'expected_enabled', 'expected_selected', 'actions_enabled'),
+    [
+        pytest.param(
+            ['twitter_1', 'bluesky_1'], (False, False), [], [], False, id='no-credentials'
+        ),
+        pytest.param(['twitter_1'], (True, False), ['twitter_1'], ['twitter_1'], True, id='single'),
+        pytest.param([], (True, True), ['twitter_1', 'bluesky_1'], [], False, id='unchecked'),
+    ],
+)
+def test_main_window_platform_state(
+    main_window_factory, selected, auth_flags, expected_enabled, expected_selected, actions_enabled
+):
+    window = main_window_factory(DummyConfig(selected), DummyAuthManager(*auth_flags))
+
+    assert window._platform_selector.get_enabled() == expected_enabled
+    assert window._platform_selector.get_selected() == expected_selected
+    assert window._post_btn.isEnabled() is actions_enabled
+    assert window._test_btn.isEnabled() is actions_enabled
+    assert window._composer._choose_btn.isEnabled() is actions_enabled
+
+
+def test_menu_action_logging(qtbot, mock_logger, monkeypatch):
     monkeypatch.setattr('src.gui.main_window.MainWindow._show_about', lambda _self: None)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
+    window = DummyMainWindow(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
     qtbot.addWidget(window)
 
     action = _find_menu_action(window, 'Help', 'About')
     action.trigger()
 
-    assert 'User selected Help > About' in logged
+    mock_logger.info.assert_any_call('User selected Help > About')
 
 
-def test_manual_update_check_no_updates_applies_theme(qtbot, monkeypatch):
+def test_manual_update_check_no_updates_applies_theme(main_window_factory, monkeypatch):
     apply_calls = []
 
     monkeypatch.setattr('src.gui.main_window.check_for_updates', lambda *_a, **_k: None)
@@ -154,55 +300,18 @@ def test_manual_update_check_no_updates_applies_theme(qtbot, monkeypatch):
         'src.gui.main_window.apply_theme',
         lambda _app, dialog, mode: apply_calls.append((dialog, mode)),
     )
-    monkeypatch.setattr(
-        'src.gui.main_window.QMessageBox',
-        type(
-            'DummyMessageBox',
-            (),
-            {
-                'Icon': QMessageBox.Icon,
-                'StandardButton': QMessageBox.StandardButton,
-                'Ok': 0,
-                'Information': 1,
-                'Warning': 2,
-                'Question': 3,
-                'Yes': 4,
-                'No': 5,
-                'StandardButtons': int,
-                '__init__': lambda *_a, **_k: None,
-                'setWindowTitle': lambda *_a, **_k: None,
-                'setText': lambda *_a, **_k: None,
-                'setIcon': lambda *_a, **_k: None,
-                'setStandardButtons': lambda *_a, **_k: None,
-                'setDefaultButton': lambda *_a, **_k: None,
-                'exec': lambda *_a, **_k: 0,
-            },
-        ),
-    )
+    monkeypatch.setattr('src.gui.main_window.QMessageBox', DummyMessageBox)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
     window._manual_update_check()
 
     assert any(mode == window._config.theme_mode for _dialog, mode in apply_calls)
 
 
-def test_main_window_missing_usernames_disables_platforms(qtbot):
-    # With no accounts returned, nothing is enabled
-    window = DummyMainWindow(
-        DummyConfig(selected=['twitter_1', 'bluesky_1']), DummyAuthManager(False, False)
-    )
-    qtbot.addWidget(window)
-
-    assert window._platform_selector.get_enabled() == []
-    assert window._platform_selector.get_selected() == []
-    assert not window._post_btn.isEnabled()
-    assert not window._test_btn.isEnabled()
-    assert not window._composer._choose_btn.isEnabled()
-
-
-def test_image_preview_opens_for_newly_enabled_platform(qtbot, tmp_path, monkeypatch):
+def test_image_preview_opens_for_newly_enabled_platform(
+    main_window_factory, fake_image, monkeypatch
+):
     calls = []
 
     class PreviewDialog:
@@ -225,56 +334,35 @@ def test_image_preview_opens_for_newly_enabled_platform(qtbot, tmp_path, monkeyp
         PreviewDialog,
     )
 
-    class ToggleAuth(DummyAuthManager):
-        def __init__(self):
-            super().__init__(twitter=True, bluesky=False)
+    auth = DummyAuthManager(twitter=True, bluesky=False)
+    window = main_window_factory(DummyConfig(['twitter_1']), auth)
 
-        def enable_bluesky(self):
-            self._bluesky = True
-
-    auth = ToggleAuth()
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), auth)
-    qtbot.addWidget(window)
-
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'fake')
+    image_path = fake_image
     window._composer.set_image_path(image_path)
 
     assert calls == [['twitter']]
 
-    auth.enable_bluesky()
+    auth._bluesky = True
     window._refresh_platform_state()
     window._platform_selector.set_selected(['twitter_1', 'bluesky_1'])
 
     assert calls[-1] == ['twitter', 'bluesky']
 
 
-def test_resubmit_does_not_regenerate_preview_when_cached(qtbot, tmp_path, monkeypatch):
+def test_resubmit_does_not_regenerate_preview_when_cached(
+    main_window_factory, fake_image, fake_processed_image, monkeypatch
+):
     calls = []
 
     def fake_preview(_image_path, platforms):
         calls.append(list(platforms))
 
-    class DummyWorker:
-        def __init__(self, *_args, **_kwargs):
-            class _Signal:
-                def connect(self, *_a, **_k):
-                    return
-
-            self.finished = _Signal()
-
-        def start(self):
-            return
-
     monkeypatch.setattr('src.gui.main_window.PostWorker', DummyWorker)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'fake')
-    processed_path = tmp_path / 'processed.png'
-    processed_path.write_bytes(b'processed')
+    image_path = fake_image
+    processed_path = fake_processed_image
 
     window._show_image_preview = fake_preview
     window._composer.set_image_path(image_path)
@@ -287,14 +375,13 @@ def test_resubmit_does_not_regenerate_preview_when_cached(qtbot, tmp_path, monke
     assert calls == []
 
 
-def test_auto_save_draft_persists_processed_images(qtbot, tmp_path, monkeypatch):
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+def test_auto_save_draft_persists_processed_images_and_reports_status(
+    main_window_factory, fake_image, fake_processed_image, tmp_path, monkeypatch
+):
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'fake')
-    processed_path = tmp_path / 'processed.png'
-    processed_path.write_bytes(b'processed')
+    image_path = fake_image
+    processed_path = fake_processed_image
 
     window._show_image_preview = lambda *_args, **_kwargs: None
     window._composer.set_text('hello')
@@ -310,21 +397,12 @@ def test_auto_save_draft_persists_processed_images(qtbot, tmp_path, monkeypatch)
     assert 'processed_images' in data
     assert 'processed.png' in data
     assert 'enabled_platforms' in data
-
-
-def test_auto_save_shows_status_message(qtbot, tmp_path, monkeypatch):
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
-    window._composer.set_text('hello')
-
-    monkeypatch.setattr('src.gui.main_window.get_drafts_dir', lambda: tmp_path)
-
-    window._auto_save_draft()
-
     assert 'Draft auto-saved' in window.statusBar().currentMessage()
 
 
-def test_successful_post_clears_draft_and_processed_images(qtbot, tmp_path, monkeypatch):
+def test_successful_post_clears_draft_and_processed_images(
+    main_window_factory, tmp_path, monkeypatch
+):
     class DummyDialog:
         def __init__(self, *_args, **_kwargs):
             self.send_logs_requested = False
@@ -335,8 +413,7 @@ def test_successful_post_clears_draft_and_processed_images(qtbot, tmp_path, monk
     monkeypatch.setattr('src.gui.main_window.ResultsDialog', DummyDialog)
     monkeypatch.setattr('src.gui.main_window.get_drafts_dir', lambda: tmp_path)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
     image_path = tmp_path / 'image.png'
     image_path.write_bytes(b'fake')
@@ -362,19 +439,18 @@ def test_successful_post_clears_draft_and_processed_images(qtbot, tmp_path, monk
     assert not draft_path.exists()
 
 
-def test_missing_processed_platforms_dedupes_bluesky(qtbot):
-    window = DummyMainWindow(
-        DummyConfig(selected=['bluesky_1', 'bluesky_alt']),
+def test_missing_processed_platforms_dedupes_bluesky(main_window_factory):
+    window = main_window_factory(
+        DummyConfig(['bluesky_1', 'bluesky_alt']),
         DummyAuthManager(False, True, True),
     )
-    qtbot.addWidget(window)
 
     missing = window._get_missing_processed_platforms(['bluesky_1', 'bluesky_alt'])
 
     assert missing == ['bluesky']
 
 
-def test_test_connections_message_includes_usernames(qtbot, monkeypatch):
+def test_test_connections_message_includes_usernames(main_window_factory, monkeypatch):
     class DummyPlatform:
         def __init__(self, success, error=None, name=''):
             self._success = success
@@ -387,11 +463,10 @@ def test_test_connections_message_includes_usernames(qtbot, monkeypatch):
         def get_platform_name(self):
             return self._name
 
-    window = DummyMainWindow(
-        DummyConfig(selected=['twitter_1', 'bluesky_1', 'bluesky_alt']),
+    window = main_window_factory(
+        DummyConfig(['twitter_1', 'bluesky_1', 'bluesky_alt']),
         DummyAuthManager(True, True, True),
     )
-    qtbot.addWidget(window)
 
     window._platforms = {
         'twitter_1': DummyPlatform(False, 'TW-AUTH-EXPIRED', 'Twitter (jasmeralia)'),
@@ -418,47 +493,9 @@ def test_test_connections_message_includes_usernames(qtbot, monkeypatch):
 
 
 def test_download_update_applies_theme_to_progress(qtbot, monkeypatch, tmp_path):
-    class DummyProgress:
-        def __init__(self, *_args, **_kwargs):
-            self.exec_called = False
-
-        def setWindowTitle(self, _title):  # noqa: N802
-            return
-
-        def setWindowModality(self, _mode):  # noqa: N802
-            return
-
-        def setMinimumDuration(self, _value):  # noqa: N802
-            return
-
-        def setAutoClose(self, _value):  # noqa: N802
-            return
-
-        def setAutoReset(self, _value):  # noqa: N802
-            return
-
-        def setValue(self, _value):  # noqa: N802
-            return
-
-        def exec(self):
-            self.exec_called = True
-            return 0
-
-    class DummyWorker:
-        def __init__(self, *_args, **_kwargs):
-            class _Signal:
-                def connect(self, *_a, **_k):
-                    return
-
-            self.progress = _Signal()
-            self.finished = _Signal()
-
-        def start(self):
-            return
-
     monkeypatch.setattr('src.gui.main_window.QProgressDialog', DummyProgress)
     monkeypatch.setattr('src.gui.main_window.UpdateDownloadWorker', DummyWorker)
-    monkeypatch.setattr('pathlib.Path.home', lambda: tmp_path)
+    monkeypatch.setattr('src.gui.main_window.get_downloads_dir', lambda: tmp_path)
 
     applied = []
 
@@ -466,7 +503,7 @@ def test_download_update_applies_theme_to_progress(qtbot, monkeypatch, tmp_path)
         def _apply_dialog_theme(self, dialog):
             applied.append(dialog)
 
-    window = DummyWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
+    window = DummyWindow(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
     qtbot.addWidget(window)
 
     update = type(
@@ -484,46 +521,26 @@ def test_download_update_applies_theme_to_progress(qtbot, monkeypatch, tmp_path)
     assert applied
 
 
-def test_show_setup_wizard_logs_failure(qtbot, monkeypatch):
-    class DummyLogger:
-        def __init__(self):
-            self.logged = False
-
-        def exception(self, *_args, **_kwargs):
-            self.logged = True
-
-    logger = DummyLogger()
-    monkeypatch.setattr('src.gui.main_window.get_logger', lambda: logger)
+def test_show_setup_wizard_logs_failure(main_window_factory, mock_logger, monkeypatch):
     monkeypatch.setattr(
         'src.gui.main_window.SetupWizard',
         lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError('boom')),
     )
     monkeypatch.setattr('src.gui.main_window.MainWindow._show_message_box', lambda *_a, **_k: 0)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
     window._show_setup_wizard_impl()
 
-    assert logger.logged
-
-
-def test_action_logging_for_post_and_connections(qtbot, monkeypatch, tmp_path):
-    logged = []
+    mock_logger.exception.assert_called_once()
 
-    class DummyLogger:
-        def info(self, message, *args, **kwargs):
-            logged.append(message)
 
-        def exception(self, *_args, **_kwargs):
-            return
-
-    logger = DummyLogger()
-    monkeypatch.setattr('src.gui.main_window.get_logger', lambda: logger)
+def test_action_logging_for_post_and_connections(
+    main_window_factory, mock_logger, fake_image, monkeypatch
+):
     monkeypatch.setattr('src.gui.main_window.MainWindow._show_message_box', lambda *_a, **_k: 0)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
     class DummyPlatform:
         def test_connection(self):
@@ -536,61 +553,35 @@ def test_action_logging_for_post_and_connections(qtbot, monkeypatch, tmp_path):
     window._platform_selector.set_selected(['twitter_1'])
 
     window._test_connections()
-    assert 'User clicked Test Connections' in logged
+    mock_logger.info.assert_any_call('User clicked Test Connections')
 
     window._composer.get_text = lambda: ''
     window._do_post()
-    assert 'User clicked Post Now' in logged
+    mock_logger.info.assert_any_call('User clicked Post Now')
 
     window._platform_selector.set_selected([])
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'fake')
+    image_path = fake_image
     window._on_image_changed(image_path)
-    assert any('User attached image' in message for message in logged)
+    mock_logger.info.assert_any_call(f'User attached image: {image_path}')
 
 
-def test_show_message_box_applies_theme(qtbot, monkeypatch):
+def test_show_message_box_applies_theme(main_window_factory, monkeypatch):
     apply_calls = []
 
     monkeypatch.setattr(
         'src.gui.main_window.apply_theme',
         lambda _app, dialog, mode: apply_calls.append((dialog, mode)),
     )
-    monkeypatch.setattr(
-        'src.gui.main_window.QMessageBox',
-        type(
-            'DummyMessageBox',
-            (),
-            {
-                'Icon': QMessageBox.Icon,
-                'StandardButton': QMessageBox.StandardButton,
-                'Ok': 0,
-                'Information': 1,
-                'Warning': 2,
-                'Question': 3,
-                'Yes': 4,
-                'No': 5,
-                'StandardButtons': int,
-                '__init__': lambda *_a, **_k: None,
-                'setWindowTitle': lambda *_a, **_k: None,
-                'setText': lambda *_a, **_k: None,
-                'setIcon': lambda *_a, **_k: None,
-                'setStandardButtons': lambda *_a, **_k: None,
-                'setDefaultButton': lambda *_a, **_k: None,
-                'exec': lambda *_a, **_k: 0,
-            },
-        ),
-    )
+    monkeypatch.setattr('src.gui.main_window.QMessageBox', DummyMessageBox)
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
     window._show_message_box('Title', 'Body', QMessageBox.Icon.Information)
 
     assert apply_calls
 
 
-def test_manual_update_check_accepts_update(qtbot, monkeypatch):
+def test_manual_update_check_accepts_update(main_window_factory, monkeypatch):
     update = type(
         'Update',
         (),
@@ -623,8 +614,7 @@ def test_manual_update_check_accepts_update(qtbot, monkeypatch):
     def fake_download(_update):
         called['downloaded'] = _update.latest_version
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
     window._download_update = fake_download
 
     window._manual_update_check()
@@ -632,7 +622,7 @@ def test_manual_update_check_accepts_update(qtbot, monkeypatch):
     assert called['downloaded'] == '1.0.1'
 
 
-def test_show_image_preview_logs_send_on_error(qtbot, monkeypatch, tmp_path):
+def test_show_image_preview_logs_send_on_error(main_window_factory, fake_image, monkeypatch):
     class PreviewDialog:
         Accepted = 1
 
@@ -655,37 +645,17 @@ def test_show_image_preview_logs_send_on_error(qtbot, monkeypatch, tmp_path):
     def fake_send_logs():
         called['sent'] = True
 
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
     window._send_logs = fake_send_logs
 
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'fake')
+    image_path = fake_image
     window._show_image_preview(image_path, ['twitter'])
 
     assert called.get('sent') is True
 
 
-def test_main_window_single_platform_enabled(qtbot):
-    window = DummyMainWindow(DummyConfig(selected=['twitter_1']), DummyAuthManager(True, False))
-    qtbot.addWidget(window)
+def test_main_window_single_platform_label_and_button_style(main_window_factory):
+    window = main_window_factory(DummyConfig(['twitter_1']), DummyAuthManager(True, False))
 
-    assert window._platform_selector.get_enabled() == ['twitter_1']
-    assert window._platform_selector.get_selected() == ['twitter_1']
-    assert window._post_btn.isEnabled()
-    assert window._test_btn.isEnabled()
-    assert window._composer._choose_btn.isEnabled()
     assert window._test_btn.styleSheet() == window._post_btn.styleSheet()
     assert window._platform_selector.get_platform_label('twitter_1') == 'Twitter (jasmeralia)'
-
-
-def test_main_window_disable_when_unchecked(qtbot):
-    window = DummyMainWindow(DummyConfig(selected=[]), DummyAuthManager(True, True))
-    qtbot.addWidget(window)
-
-    assert 'twitter_1' in window._platform_selector.get_enabled()
-    assert 'bluesky_1' in window._platform_selector.get_enabled()
-    assert window._platform_selector.get_selected() == []
-    assert not window._post_btn.isEnabled()
-    assert not window._test_btn.isEnabled()
-    assert not window._composer._choose_btn.isEnabled()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
+
 from src.platforms.bluesky import BlueskyPlatform
 from src.platforms.twitter import TwitterPlatform
 
@@ -28,6 +30,30 @@ class _FakeAuth:
         return self._bluesky
 
 
+@pytest.fixture(scope='module')
+def twitter_auth():
+    return _FakeAuth(
+        twitter={
+            'api_key': 'k',
+            'api_secret': 's',
+            'access_token': 't',
+            'access_token_secret': 'ts',
+            'username': 'tester',
+        }
+    )
+
+
+@pytest.fixture(scope='module')
+def bluesky_auth():
+    return _FakeAuth(
+        bluesky={
+            'identifier': 'user.bsky.social',
+            'app_password': 'pw',
+            'service': 'https://bsky.social',
+        }
+    )
+
+
 class _FakeOAuth:
     def __init__(self, *args, **kwargs):
         self.args = args
@@ -43,9 +69,10 @@ class _FakeTwitterAPI:
 
 
 class _FakeTwitterClient:
+    _me = SimpleNamespace(data=SimpleNamespace(username='tester'))
+
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self._me = SimpleNamespace(data=SimpleNamespace(username='tester'))
 
     def get_me(self):
         return self._me
@@ -66,32 +93,25 @@ class _ForbiddenError(Exception):
     pass
 
 
-def test_twitter_post_success(monkeypatch, tmp_path):
+# Everything a fake tweepy module needs except Client, which tests vary.
+_BASE_TWEEPY_KW = {
+    'OAuth1UserHandler': _FakeOAuth,
+    'API': _FakeTwitterAPI,
+    'Unauthorized': _UnauthorizedError,
+    'TooManyRequests': _TooManyRequestsError,
+    'Forbidden': _ForbiddenError,
+}
+
+
+def test_twitter_post_success(twitter_auth, fake_image, monkeypatch):
     import src.platforms.twitter as twitter_mod
 
-    fake_tweepy = SimpleNamespace(
-        OAuth1UserHandler=_FakeOAuth,
-        API=_FakeTwitterAPI,
-        Client=_FakeTwitterClient,
-        Unauthorized=_UnauthorizedError,
-        TooManyRequests=_TooManyRequestsError,
-        Forbidden=_ForbiddenError,
-    )
+    fake_tweepy = SimpleNamespace(Client=_FakeTwitterClient, **_BASE_TWEEPY_KW)
     monkeypatch.setattr(twitter_mod, 'tweepy', fake_tweepy)
 
-    auth = _FakeAuth(
-        twitter={
-            'api_key': 'k',
-            'api_secret': 's',
-            'access_token': 't',
-            'access_token_secret': 'ts',
-            'username': 'tester',
-        }
-    )
-    platform = TwitterPlatform(auth)
+    platform = TwitterPlatform(twitter_auth)
 
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'data')
+    image_path = fake_image
 
     result = platform.post('Hello', image_path=image_path)
 
@@ -99,33 +119,17 @@ def test_twitter_post_success(monkeypatch, tmp_path):
     assert result.post_url == 'https://twitter.com/tester/status/tweet123'
 
 
-def test_twitter_test_connection_unauthorized(monkeypatch):
+def test_twitter_test_connection_unauthorized(twitter_auth, monkeypatch):
     import src.platforms.twitter as twitter_mod
 
     class _BadClient(_FakeTwitterClient):
         def get_me(self):
             raise _UnauthorizedError('nope')
 
-    fake_tweepy = SimpleNamespace(
-        OAuth1UserHandler=_FakeOAuth,
-        API=_FakeTwitterAPI,
-        Client=_BadClient,
-        Unauthorized=_UnauthorizedError,
-        TooManyRequests=_TooManyRequestsError,
-        Forbidden=_ForbiddenError,
-    )
+    fake_tweepy = SimpleNamespace(Client=_BadClient, **_BASE_TWEEPY_KW)
     monkeypatch.setattr(twitter_mod, 'tweepy', fake_tweepy)
 
-    auth = _FakeAuth(
-        twitter={
-            'api_key': 'k',
-            'api_secret': 's',
-            'access_token': 't',
-            'access_token_secret': 'ts',
-            'username': 'tester',
-        }
-    )
-    platform = TwitterPlatform(auth)
+    platform = TwitterPlatform(twitter_auth)
 
     success, error = platform.test_connection()
 
@@ -159,22 +163,14 @@ class _FailingBskyClient(_FakeBskyClient):
         raise RuntimeError('upload failed')
 
 
-def test_bluesky_post_success(monkeypatch, tmp_path):
+def test_bluesky_post_success(bluesky_auth, fake_image, monkeypatch):
     import src.platforms.bluesky as bluesky_mod
 
     monkeypatch.setattr(bluesky_mod, 'BskyClient', _FakeBskyClient)
 
-    auth = _FakeAuth(
-        bluesky={
-            'identifier': 'user.bsky.social',
-            'app_password': 'pw',
-            'service': 'https://bsky.social',
-        }
-    )
-    platform = BlueskyPlatform(auth)
+    platform = BlueskyPlatform(bluesky_auth)
 
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'data')
+    image_path = fake_image
 
     result = platform.post('Hello', image_path=image_path)
 
@@ -182,22 +178,14 @@ def test_bluesky_post_success(monkeypatch, tmp_path):
     assert result.post_url.endswith('/post/abc123')
 
 
-def test_bluesky_image_upload_failure(monkeypatch, tmp_path):
+def test_bluesky_image_upload_failure(bluesky_auth, fake_image, monkeypatch):
     import src.platforms.bluesky as bluesky_mod
 
     monkeypatch.setattr(bluesky_mod, 'BskyClient', _FailingBskyClient)
 
-    auth = _FakeAuth(
-        bluesky={
-            'identifier': 'user.bsky.social',
-            'app_password': 'pw',
-            'service': 'https://bsky.social',
-        }
-    )
-    platform = BlueskyPlatform(auth)
+    platform = BlueskyPlatform(bluesky_auth)
 
-    image_path = tmp_path / 'image.png'
-    image_path.write_bytes(b'data')
+    image_path = fake_image
 
     result = platform.post('Hello', image_path=image_path)
 
@@ -1,49 +1,50 @@
 """Tests for platform implementations."""
 
+import pytest
+
 from src.platforms.bluesky import detect_urls
 from src.utils.constants import BLUESKY_SPECS, TWITTER_SPECS
 
 
 class TestDetectUrls:
-    def test_no_urls(self):
-        assert detect_urls('Just a normal post') == []
-
-    def test_single_url(self):
-        facets = detect_urls('Check out https://example.com today')
-        assert len(facets) == 1
-        assert facets[0]['features'][0]['uri'] == 'https://example.com'
-
-    def test_multiple_urls(self):
-        text = 'Visit https://one.com and http://two.com'
-        facets = detect_urls(text)
-        assert len(facets) == 2
-
-    def test_url_with_path(self):
-        text = 'Test https://rin-city.com/envira/orinnixi/'
-        facets = detect_urls(text)
-        assert facets[0]['features'][0]['uri'] == 'https://rin-city.com/envira/orinnixi/'
-        start = text.index('https://rin-city.com/envira/orinnixi/')
-        end = start + len('https://rin-city.com/envira/orinnixi/')
-        assert facets[0]['index']['byteStart'] == start
-        assert facets[0]['index']['byteEnd'] == end
-
-    def test_byte_offsets_ascii(self):
-        text = 'Go to https://example.com now'
-        facets = detect_urls(text)
-        url = 'https://example.com'
-        start = text.index(url)
-        end = start + len(url)
-        assert facets[0]['index']['byteStart'] == start
-        assert facets[0]['index']['byteEnd'] == end
-
-    def test_byte_offsets_unicode(self):
-        # Emoji before URL shifts byte offset
-        text = '\U0001f525 https://example.com'
+    @pytest.mark.parametrize(
+        ('text', 'expected'),
+        [
+            pytest.param('Just a normal post', [], id='no-urls'),
+            pytest.param(
+                'Check out https://example.com today',
+                [('https://example.com', 10, 29)],
+                id='single',
+            ),
+            pytest.param(
+                'Visit https://one.com and http://two.com',
+                [('https://one.com', 6, 21), ('http://two.com', 26, 40)],
+                id='multiple',
+            ),
+            pytest.param(
+                'Test https://rin-city.com/envira/orinnixi/',
+                [('https://rin-city.com/envira/orinnixi/', 5, 42)],
+                id='with-path',
+            ),
+            pytest.param(
+                'Go to https://example.com now',
+                [('https://example.com', 6, 25)],
+                id='ascii-offsets',
+            ),
+            # Fire emoji is 4 bytes in UTF-8, plus space = 5 bytes
+            pytest.param(
+                '\U0001f525 https://example.com',
+                [('https://example.com', 5, 24)],
+                id='unicode-offsets',
+            ),
+        ],
+    )
+    def test_detect_urls(self, text, expected):
         facets = detect_urls(text)
-        # Fire emoji is 4 bytes in UTF-8, plus space = 5 bytes
-        assert facets[0]['index']['byteStart'] == 5
-        url = 'https://example.com'
-        assert facets[0]['index']['byteEnd'] == 5 + len(url.encode('utf-8'))
+        assert [
+            (f['features'][0]['uri'], f['index']['byteStart'], f['index']['byteEnd'])
+            for f in facets
+        ] == expected
 
     def test_facet_structure(self):
         facets = detect_urls('https://example.com')
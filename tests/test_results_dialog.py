@@ -4,11 +4,14 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
 from PyQt6.QtWidgets import QApplication, QLabel, QPushButton
 
 from src.gui.results_dialog import ResultsDialog
 from src.utils.constants import PostResult
 
+pytestmark = pytest.mark.qt
+
 
 def _fake_clipboard(captured):
     def set_text(text):
@@ -17,61 +20,65 @@ def _fake_clipboard(captured):
     return SimpleNamespace(setText=set_text)
 
 
-def test_results_dialog_success_shows_links(qtbot, monkeypatch):
-    captured = {}
-    monkeypatch.setattr(QApplication, 'clipboard', staticmethod(lambda: _fake_clipboard(captured)))
+def _click(dialog, button_text):
+    next(btn for btn in dialog.findChildren(QPushButton) if btn.text() == button_text).click()
 
-    results = [PostResult(success=True, platform='Twitter', post_url='https://example.com')]
-    dialog = ResultsDialog(results)
-    qtbot.addWidget(dialog)
 
+def _links_shown_and_copied(dialog, captured):
     labels = dialog.findChildren(QLabel)
     assert any('https://example.com' in label.text() for label in labels)
     assert any(label.openExternalLinks() for label in labels)
-
-    copy_all = next(
-        btn for btn in dialog.findChildren(QPushButton) if btn.text() == 'Copy All Links'
-    )
-    copy_all.click()
-
     assert 'https://example.com' in captured['text']
 
 
-def test_results_dialog_failure_shows_send_logs(qtbot):
-    results = [
-        PostResult(
-            success=False,
-            platform='Twitter',
-            error_code='POST-FAILED',
-            error_message='Failed',
-        )
-    ]
-    dialog = ResultsDialog(results)
-    qtbot.addWidget(dialog)
+def _send_logs_requested(dialog, _captured):
+    assert dialog.send_logs_requested
 
-    send_btn = next(
-        btn for btn in dialog.findChildren(QPushButton) if btn.text() == 'Send Logs to Jas'
-    )
-    send_btn.click()
 
-    assert dialog.send_logs_requested
+def _settings_result(dialog, _captured):
+    assert dialog.result() == 2
 
 
-def test_results_dialog_open_settings_sets_result(qtbot):
-    results = [
-        PostResult(
-            success=False,
-            platform='Bluesky',
-            error_code='BS-AUTH-EXPIRED',
-            error_message='Expired',
-        )
-    ]
-    dialog = ResultsDialog(results)
+@pytest.mark.parametrize(
+    ('result', 'button_text', 'check'),
+    [
+        pytest.param(
+            PostResult(success=True, platform='Twitter', post_url='https://example.com'),
+            'Copy All Links',
+            _links_shown_and_copied,
+            id='success-copy-links',
+        ),
+        pytest.param(
+            PostResult(
+                success=False,
+                platform='Twitter',
+                error_code='POST-FAILED',
+                error_message='Failed',
+            ),
+            'Send Logs to Jas',
+            _send_logs_requested,
+            id='failure-send-logs',
+        ),
+        pytest.param(
+            PostResult(
+                success=False,
+                platform='Bluesky',
+                error_code='BS-AUTH-EXPIRED',
+                error_message='Expired',
+            ),
+            'Open Settings',
+            _settings_result,
+            id='auth-expired-open-settings',
+        ),
+    ],
+)
+def test_results_dialog_button(qtbot, monkeypatch, result, button_text, check):
+    captured = {}
+    monkeypatch.setattr(QApplication, 'clipboard', staticmethod(lambda: _fake_clipboard(captured)))
+
+    dialog = ResultsDialog([result])
     qtbot.addWidget(dialog)
 
-    settings_btn = next(
-        btn for btn in dialog.findChildren(QPushButton) if btn.text() == 'Open Settings'
-    )
-    settings_btn.click()
+    _click(dialog, button_text)
 
-    assert dialog.result() == 2
+    check(dialog, captured)
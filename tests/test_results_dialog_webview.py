@@ -1,10 +1,20 @@
 """Tests for results dialog with WebView platform states."""
 
+import re
+
+import pytest
 from PyQt6.QtWidgets import QLabel
 
 from src.gui.results_dialog import ResultsDialog
 from src.utils.constants import PostResult
 
+pytestmark = pytest.mark.qt
+
+
+def _label_texts(dialog: ResultsDialog) -> list[str]:
+    """Read every label's text once so assertions scan plain strings."""
+    return [label.text() for label in dialog.findChildren(QLabel)]
+
 
 def test_webview_posted_with_url(qtbot):
     """Test WebView result with URL captured."""
@@ -20,9 +30,9 @@ def test_webview_posted_with_url(qtbot):
     dialog = ResultsDialog(results)
     qtbot.addWidget(dialog)
 
-    labels = dialog.findChildren(QLabel)
-    assert any('https://fetlife.com/posts/123456' in label.text() for label in labels)
-    assert any('Posted successfully!' in label.text() for label in labels)
+    texts = _label_texts(dialog)
+    assert any('https://fetlife.com/posts/123456' in text for text in texts)
+    assert any('Posted successfully!' in text for text in texts)
 
 
 def test_webview_posted_without_url(qtbot):
@@ -39,9 +49,8 @@ def test_webview_posted_without_url(qtbot):
     dialog = ResultsDialog(results)
     qtbot.addWidget(dialog)
 
-    labels = dialog.findChildren(QLabel)
     # Should show "Posted (link unavailable)"
-    assert any('Posted' in label.text() and 'unavailable' in label.text() for label in labels)
+    assert any('Posted' in text and 'unavailable' in text for text in _label_texts(dialog))
 
 
 def test_webview_not_confirmed(qtbot):
@@ -60,10 +69,10 @@ def test_webview_not_confirmed(qtbot):
     dialog = ResultsDialog(results)
     qtbot.addWidget(dialog)
 
-    labels = dialog.findChildren(QLabel)
-    assert any(
-        'Not confirmed' in label.text() or 'failed' in label.text().lower() for label in labels
-    )
+    assert any('Not confirmed' in text or 'failed' in text.lower() for text in _label_texts(dialog))
+
+
+_PLATFORM_NAMES_RE = re.compile(r'Twitter|FetLife|OnlyFans|Fansly')
 
 
 def test_mixed_api_and_webview_results(qtbot):
@@ -106,18 +115,14 @@ def test_mixed_api_and_webview_results(qtbot):
     dialog = ResultsDialog(results)
     qtbot.addWidget(dialog)
 
-    labels = dialog.findChildren(QLabel)
-    text = ' '.join(label.text() for label in labels)
+    texts = _label_texts(dialog)
 
     # All platforms should be mentioned
-    assert 'Twitter' in text
-    assert 'FetLife' in text
-    assert 'OnlyFans' in text
-    assert 'Fansly' in text
+    mentioned = {name for text in texts for name in _PLATFORM_NAMES_RE.findall(text)}
+    assert mentioned == {'Twitter', 'FetLife', 'OnlyFans', 'Fansly'}
 
     # Should have 2 clickable URLs
-    links = [label for label in labels if 'https://' in label.text()]
-    assert len(links) >= 2
+    assert sum('https://' in label for label in texts) >= 2
 
 
 def test_webview_error_codes(qtbot):
@@ -139,8 +144,7 @@ def test_webview_error_codes(qtbot):
     dialog = ResultsDialog(results)
     qtbot.addWidget(dialog)
 
-    labels = dialog.findChildren(QLabel)
-    text = ' '.join(label.text() for label in labels)
+    text = ' '.join(_label_texts(dialog))
 
     assert 'WV-LOAD-FAILED' in text or 'load' in text.lower()
     assert 'WV-SESSION-EXPIRED' in text or 'session' in text.lower()
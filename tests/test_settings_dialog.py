@@ -3,32 +3,21 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import MagicMock
 
-from src.core.auth_manager import AuthManager
-from src.core.config_manager import ConfigManager
-from src.gui.settings_dialog import SettingsDialog
-
-
-def _make_config(tmp_path, monkeypatch) -> ConfigManager:
-    import src.core.config_manager as config_manager
-
-    monkeypatch.setattr(config_manager, 'get_app_data_dir', lambda: tmp_path)
-    return ConfigManager()
-
+import pytest
 
-def _make_auth(tmp_path, monkeypatch) -> AuthManager:
-    import src.core.auth_manager as auth_manager
+from src.gui.settings_dialog import SettingsDialog
 
-    monkeypatch.setattr(auth_manager, 'get_auth_dir', lambda: tmp_path / 'auth')
-    return AuthManager()
+pytestmark = pytest.mark.qt
 
 
-def test_settings_dialog_saves_config_and_auth(qtbot, tmp_path, monkeypatch):
-    config = _make_config(tmp_path, monkeypatch)
-    auth = _make_auth(tmp_path, monkeypatch)
-    auth.save_account_credentials('twitter_1', {'access_token': 't', 'access_token_secret': 'ts'})
+def test_settings_dialog_saves_config_and_auth(qtbot, tmp_config, tmp_auth, settings_dir):
+    tmp_auth.save_account_credentials(
+        'twitter_1', {'access_token': 't', 'access_token_secret': 'ts'}
+    )
 
-    dialog = SettingsDialog(config, auth)
+    dialog = SettingsDialog(tmp_config, tmp_auth)
     qtbot.addWidget(dialog)
 
     dialog._auto_update_cb.setChecked(False)
@@ -49,28 +38,27 @@ def test_settings_dialog_saves_config_and_auth(qtbot, tmp_path, monkeypatch):
 
     dialog._save_and_close()
 
-    assert config.auto_check_updates is False
-    assert config.allow_prerelease_updates is True
-    assert config.auto_save_draft is False
-    assert config.debug_mode is True
-    assert config.log_upload_enabled is False
-    assert config.log_upload_endpoint == 'https://example.com/logs'
+    assert tmp_config.auto_check_updates is False
+    assert tmp_config.allow_prerelease_updates is True
+    assert tmp_config.auto_save_draft is False
+    assert tmp_config.debug_mode is True
+    assert tmp_config.log_upload_enabled is False
+    assert tmp_config.log_upload_endpoint == 'https://example.com/logs'
 
-    twitter_app = json.loads((tmp_path / 'auth' / 'twitter_app_auth.json').read_text())
+    twitter_app = json.loads((settings_dir / 'auth' / 'twitter_app_auth.json').read_bytes())
     assert twitter_app['api_key'] == 'k'
-    assert auth.get_account('twitter_1').profile_name == 'tester'
+    assert tmp_auth.get_account('twitter_1').profile_name == 'tester'
 
-    bluesky_auth = json.loads((tmp_path / 'auth' / 'bluesky_auth.json').read_text())
+    bluesky_auth = json.loads((settings_dir / 'auth' / 'bluesky_auth.json').read_bytes())
     assert bluesky_auth['identifier'] == 'user.bsky.social'
-    bluesky_alt = json.loads((tmp_path / 'auth' / 'bluesky_auth_alt.json').read_text())
+    bluesky_alt = json.loads((settings_dir / 'auth' / 'bluesky_auth_alt.json').read_bytes())
     assert bluesky_alt['identifier'] == 'alt.bsky.social'
 
 
-def test_settings_dialog_does_not_save_incomplete_twitter(qtbot, tmp_path, monkeypatch):
-    config = _make_config(tmp_path, monkeypatch)
-    auth = _make_auth(tmp_path, monkeypatch)
-
-    dialog = SettingsDialog(config, auth)
+def test_settings_dialog_does_not_save_incomplete_twitter(
+    qtbot, tmp_config, tmp_auth, settings_dir
+):
+    dialog = SettingsDialog(tmp_config, tmp_auth)
     qtbot.addWidget(dialog)
 
     dialog._twitter_accounts['twitter_1']['username'].setText('tester')
@@ -79,14 +67,13 @@ def test_settings_dialog_does_not_save_incomplete_twitter(qtbot, tmp_path, monke
 
     dialog._save_and_close()
 
-    assert not (tmp_path / 'auth' / 'twitter_1_auth.json').exists()
-
+    assert not (settings_dir / 'auth' / 'twitter_1_auth.json').exists()
 
-def test_settings_dialog_blocks_duplicate_bluesky(qtbot, tmp_path, monkeypatch):
-    config = _make_config(tmp_path, monkeypatch)
-    auth = _make_auth(tmp_path, monkeypatch)
 
-    dialog = SettingsDialog(config, auth)
+def test_settings_dialog_blocks_duplicate_bluesky(
+    qtbot, tmp_config, tmp_auth, settings_dir, monkeypatch
+):
+    dialog = SettingsDialog(tmp_config, tmp_auth)
     qtbot.addWidget(dialog)
 
     dialog._bs_identifier.setText('same.bsky.social')
@@ -94,29 +81,23 @@ def test_settings_dialog_blocks_duplicate_bluesky(qtbot, tmp_path, monkeypatch):
     dialog._bs_alt_identifier.setText('same.bsky.social')
     dialog._bs_alt_app_password.setText('pw')
 
-    warnings = []
-
-    def fake_warning(*_args, **_kwargs):
-        warnings.append(True)
-
-    monkeypatch.setattr('src.gui.settings_dialog.QMessageBox.warning', fake_warning)
+    warning = MagicMock()
+    monkeypatch.setattr('src.gui.settings_dialog.QMessageBox.warning', warning)
 
     dialog._save_and_close()
 
-    assert warnings
-    assert not (tmp_path / 'auth' / 'bluesky_auth_alt.json').exists()
+    warning.assert_called_once()
+    assert not (settings_dir / 'auth' / 'bluesky_auth_alt.json').exists()
 
 
-def test_settings_dialog_logout_clears_auth(qtbot, tmp_path, monkeypatch):
-    config = _make_config(tmp_path, monkeypatch)
-    auth = _make_auth(tmp_path, monkeypatch)
-    auth.save_bluesky_auth_alt('alt.bsky.social', 'pw')
+def test_settings_dialog_logout_clears_auth(qtbot, tmp_config, tmp_auth, settings_dir):
+    tmp_auth.save_bluesky_auth_alt('alt.bsky.social', 'pw')
 
-    dialog = SettingsDialog(config, auth)
+    dialog = SettingsDialog(tmp_config, tmp_auth)
     qtbot.addWidget(dialog)
 
-    assert (tmp_path / 'auth' / 'bluesky_auth_alt.json').exists()
+    assert (settings_dir / 'auth' / 'bluesky_auth_alt.json').exists()
 
     dialog._logout_bluesky_alt()
 
-    assert not (tmp_path / 'auth' / 'bluesky_auth_alt.json').exists()
+    assert not (settings_dir / 'auth' / 'bluesky_auth_alt.json').exists()
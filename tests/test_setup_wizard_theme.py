@@ -1,7 +1,10 @@
+import pytest
 from PyQt6.QtWidgets import QWizard
 
 from src.gui.setup_wizard import SetupWizard
 
+pytestmark = pytest.mark.qt
+
 
 class DummyAuthManager:
     def get_twitter_app_credentials(self):
@@ -26,8 +29,6 @@ class DummyAuthManager:
 def test_setup_wizard_applies_style(qtbot):
     wizard = SetupWizard(DummyAuthManager(), theme_mode='dark')
     qtbot.addWidget(wizard)
-    wizard.show()
-    qtbot.waitExposed(wizard)
 
     assert wizard.wizardStyle() == QWizard.WizardStyle.ModernStyle
     assert wizard.autoFillBackground() is True
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from PyQt6.QtWidgets import QApplication, QMainWindow
+import pytest
+from PyQt6.QtWidgets import QMainWindow
 
 import src.utils.theme as theme
 
+pytestmark = pytest.mark.qt
+
+
+@pytest.fixture(scope='module')
+def window(qapp):
+    """One never-shown window; apply_theme only needs a target, not an exposed one."""
+    window = QMainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+
 
 def test_resolve_theme_mode_explicit():
     assert theme.resolve_theme_mode('dark') == 'dark'
@@ -24,12 +36,7 @@ def test_resolve_theme_mode_system_prefers_light(monkeypatch):
     assert theme.resolve_theme_mode('system') == 'light'
 
 
-def test_apply_theme_calls_title_bar(qtbot, monkeypatch):
-    window = QMainWindow()
-    qtbot.addWidget(window)
-    app = QApplication.instance()
-    assert app is not None
-
+def test_apply_theme_calls_title_bar(qapp, window, monkeypatch):
     calls: list[bool] = []
 
     def fake_title_bar(win, enabled):
@@ -37,20 +44,57 @@ def test_apply_theme_calls_title_bar(qtbot, monkeypatch):
 
     monkeypatch.setattr(theme, 'set_windows_dark_title_bar', fake_title_bar)
 
-    resolved = theme.apply_theme(app, window, 'dark')
+    resolved = theme.apply_theme(qapp, window, 'dark')
 
     assert resolved == 'dark'
     assert calls == [True]
 
 
-def test_apply_theme_light_palette(qtbot, monkeypatch):
-    window = QMainWindow()
-    qtbot.addWidget(window)
-    app = QApplication.instance()
-    assert app is not None
-
+def test_apply_theme_light_palette(qapp, window, monkeypatch):
     monkeypatch.setattr(theme, 'set_windows_dark_title_bar', lambda *_: None)
 
-    resolved = theme.apply_theme(app, window, 'light')
+    resolved = theme.apply_theme(qapp, window, 'light')
 
     assert resolved == 'light'
+    assert qapp.palette() == theme._STANDARD_PALETTES['fusion']
+
+
+def test_dark_palette_is_built_once(qapp):
+    assert theme._get_dark_palette() is theme._get_dark_palette()
+
+
+def test_dark_title_bar_stops_after_first_success(window, monkeypatch):
+    attrs: list[int] = []
+
+    def fake_set_attribute(hwnd, attr, value, size):
+        attrs.append(attr)
+        return 0
+
+    monkeypatch.setattr(theme.sys, 'platform', 'win32')
+    monkeypatch.setattr(theme, '_get_dwm_set_window_attribute', lambda: fake_set_attribute)
+
+    theme.set_windows_dark_title_bar(window, True)
+
+    assert attrs == [20]
+
+
+def test_standard_palette_cached_per_style(qapp, monkeypatch):
+    monkeypatch.setattr(theme, '_STANDARD_PALETTES', {})
+    monkeypatch.setattr(theme, 'set_windows_dark_title_bar', lambda *_: None)
+
+    theme.apply_theme(qapp, None, 'light')
+    theme.apply_theme(qapp, None, 'light')
+
+    assert list(theme._STANDARD_PALETTES) == ['fusion']
+
+
+def test_apply_theme_keeps_existing_fusion_style(qapp, monkeypatch):
+    monkeypatch.setattr(theme, 'set_windows_dark_title_bar', lambda *_: None)
+    theme.apply_theme(qapp, None, 'light')
+
+    calls: list[str] = []
+    monkeypatch.setattr(qapp, 'setStyle', lambda name: calls.append(name))
+
+    theme.apply_theme(qapp, None, 'dark')
+
+    assert calls == []
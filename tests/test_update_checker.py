@@ -1,3 +1,5 @@
+import pytest
+
 import src.core.update_checker as update_checker
 
 
@@ -10,65 +12,50 @@ class _Response:
         return self._payload
 
 
-def test_updates_skip_prerelease_when_disabled(monkeypatch):
-    releases = [
-        {'tag_name': 'v0.2.9-beta.1', 'prerelease': True, 'draft': False, 'assets': []},
-        {'tag_name': 'v0.2.8', 'prerelease': False, 'draft': False, 'assets': []},
-    ]
-
-    monkeypatch.setattr(update_checker, 'APP_VERSION', '0.2.7')
-    monkeypatch.setattr(
-        update_checker.requests, 'get', lambda *_args, **_kwargs: _Response(releases)
-    )
-
-    update = update_checker.check_for_updates(include_prerelease=False)
-    assert update is not None
-    assert update.latest_version == '0.2.8'
-    assert update.is_prerelease is False
-
-
-def test_updates_include_prerelease_when_enabled(monkeypatch):
-    releases = [
-        {'tag_name': 'v0.2.9-beta.1', 'prerelease': True, 'draft': False, 'assets': []},
-        {'tag_name': 'v0.2.8', 'prerelease': False, 'draft': False, 'assets': []},
-    ]
-
-    monkeypatch.setattr(update_checker, 'APP_VERSION', '0.2.7')
-    monkeypatch.setattr(
-        update_checker.requests, 'get', lambda *_args, **_kwargs: _Response(releases)
-    )
-
-    update = update_checker.check_for_updates(include_prerelease=True)
-    assert update is not None
-    assert update.latest_version == '0.2.9-beta.1'
-    assert update.is_prerelease is True
-
-
-def test_updates_ignore_drafts(monkeypatch):
-    releases = [
-        {'tag_name': 'v0.2.9', 'prerelease': False, 'draft': True, 'assets': []},
-        {'tag_name': 'v0.2.8', 'prerelease': False, 'draft': False, 'assets': []},
-    ]
-
-    monkeypatch.setattr(update_checker, 'APP_VERSION', '0.2.7')
-    monkeypatch.setattr(
-        update_checker.requests, 'get', lambda *_args, **_kwargs: _Response(releases)
-    )
-
-    update = update_checker.check_for_updates(include_prerelease=False)
-    assert update is not None
-    assert update.latest_version == '0.2.8'
-
-
-def test_updates_return_none_when_up_to_date(monkeypatch):
-    releases = [
-        {'tag_name': 'v0.2.8', 'prerelease': False, 'draft': False, 'assets': []},
-    ]
-
-    monkeypatch.setattr(update_checker, 'APP_VERSION', '0.2.8')
-    monkeypatch.setattr(
-        update_checker.requests, 'get', lambda *_args, **_kwargs: _Response(releases)
-    )
-
-    update = update_checker.check_for_updates(include_prerelease=False)
-    assert update is None
+@pytest.fixture
+def patch_releases(monkeypatch):
+    """Serve `releases` from the GitHub API and pretend to be `app_version`."""
+
+    def _apply(releases, app_version):
+        monkeypatch.setattr(update_checker, 'APP_VERSION', app_version)
+        monkeypatch.setattr(
+            update_checker.requests, 'get', lambda *_args, **_kwargs: _Response(releases)
+        )
+
+    return _apply
+
+
+_BETA = {'tag_name': 'v0.2.9-beta.1', 'prerelease': True, 'draft': False, 'assets': []}
+_DRAFT = {'tag_name': 'v0.2.9', 'prerelease': False, 'draft': True, 'assets': []}
+_STABLE = {'tag_name': 'v0.2.8', 'prerelease': False, 'draft': False, 'assets': []}
+
+
+@pytest.mark.parametrize(
+    ('releases', 'app_version', 'include_prerelease', 'expected_version', 'expected_prerelease'),
+    [
+        pytest.param([_BETA, _STABLE], '0.2.7', False, '0.2.8', False, id='skip-prerelease'),
+        pytest.param(
+            [_BETA, _STABLE], '0.2.7', True, '0.2.9-beta.1', True, id='include-prerelease'
+        ),
+        pytest.param([_DRAFT, _STABLE], '0.2.7', False, '0.2.8', False, id='ignore-drafts'),
+        pytest.param([_STABLE], '0.2.8', False, None, None, id='up-to-date'),
+    ],
+)
+def test_check_for_updates(
+    patch_releases,
+    releases,
+    app_version,
+    include_prerelease,
+    expected_version,
+    expected_prerelease,
+):
+    patch_releases(releases, app_version)
+
+    update = update_checker.check_for_updates(include_prerelease=include_prerelease)
+
+    if expected_version is None:
+        assert update is None
+    else:
+        assert update is not None
+        assert update.latest_version == expected_version
+        assert update.is_prerelease is expected_prerelease
@@ -1,24 +1,29 @@
+from dataclasses import dataclass, field
 from types import SimpleNamespace
 
+import pytest
+
 import src.gui.main_window as main_window
 from src.gui.main_window import MainWindow
 from src.utils.constants import AccountConfig
 
+pytestmark = pytest.mark.qt
+
 
 class DummyAuthManager:
+    _ACCOUNTS = (
+        AccountConfig(platform_id='twitter', account_id='twitter_1', profile_name='user'),
+        AccountConfig(
+            platform_id='bluesky', account_id='bluesky_1', profile_name='user.bsky.social'
+        ),
+    )
+    _BY_ID = {account.account_id: account for account in _ACCOUNTS}
+
     def get_accounts(self):
-        return [
-            AccountConfig(platform_id='twitter', account_id='twitter_1', profile_name='user'),
-            AccountConfig(
-                platform_id='bluesky', account_id='bluesky_1', profile_name='user.bsky.social'
-            ),
-        ]
+        return list(self._ACCOUNTS)
 
     def get_account(self, account_id):
-        for a in self.get_accounts():
-            if a.account_id == account_id:
-                return a
-        return None
+        return self._BY_ID.get(account_id)
 
     def get_account_credentials(self, account_id):
         return None
@@ -27,7 +32,7 @@ class DummyAuthManager:
         return None
 
     def get_accounts_for_platform(self, platform_id):
-        return [a for a in self.get_accounts() if a.platform_id == platform_id]
+        return [a for a in self._ACCOUNTS if a.platform_id == platform_id]
 
     def has_twitter_auth(self):
         return True
@@ -48,19 +53,21 @@ class DummyAuthManager:
         return None
 
 
+@dataclass(slots=True)
 class DummyConfig:
-    def __init__(self):
-        self.last_selected_platforms = ['twitter_1', 'bluesky_1']
-        self.last_image_directory = ''
-        self.auto_save_draft = False
-        self.draft_interval = 30
-        self.auto_check_updates = False
-        self.allow_prerelease_updates = True
-        self.theme_mode = 'dark'
-        self.window_geometry = {'x': 0, 'y': 0, 'width': 800, 'height': 600}
-        self.log_upload_endpoint = 'https://example.invalid'
-        self.log_upload_enabled = True
-        self.debug_mode = False
+    last_selected_platforms: list[str] = field(default_factory=lambda: ['twitter_1', 'bluesky_1'])
+    window_geometry: dict[str, int] = field(
+        default_factory=lambda: {'x': 0, 'y': 0, 'width': 800, 'height': 600}
+    )
+    last_image_directory: str = ''
+    auto_save_draft: bool = False
+    draft_interval: int = 30
+    auto_check_updates: bool = False
+    allow_prerelease_updates: bool = True
+    theme_mode: str = 'dark'
+    log_upload_endpoint: str = 'https://example.invalid'
+    log_upload_enabled: bool = True
+    debug_mode: bool = False
 
     def save(self):
         return
@@ -74,20 +81,39 @@ class DummyMainWindow(MainWindow):
         return
 
 
-def test_update_dialog_labels_beta(qtbot, monkeypatch):
+# Everything an update result needs except is_prerelease, which tests vary.
+_BASE_UPDATE = {
+    'latest_version': '0.2.99',
+    'current_version': '0.2.0',
+    'release_name': 'Release',
+    'release_notes': 'Notes',
+    'download_url': '',
+    'download_size': 0,
+    'browser_url': '',
+}
+
+
+@pytest.fixture(scope='module')
+def window(qapp):
+    """One window for the module; only _manual_update_check's dialog path varies."""
+    window = DummyMainWindow(DummyConfig(), DummyAuthManager())
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+@pytest.mark.parametrize(
+    ('is_prerelease', 'expected_label'),
+    [
+        pytest.param(True, 'beta', id='beta'),
+        pytest.param(False, 'stable', id='stable'),
+    ],
+)
+def test_update_dialog_label(window, monkeypatch, is_prerelease, expected_label):
     captured = {}
     apply_calls = []
 
-    update = SimpleNamespace(
-        latest_version='0.2.99',
-        current_version='0.2.0',
-        release_name='Beta Release',
-        release_notes='Beta notes',
-        download_url='',
-        download_size=0,
-        browser_url='',
-        is_prerelease=True,
-    )
+    update = SimpleNamespace(**_BASE_UPDATE, is_prerelease=is_prerelease)
 
     monkeypatch.setattr(main_window, 'check_for_updates', lambda *_args, **_kwargs: update)
     monkeypatch.setattr(
@@ -107,43 +133,6 @@ def test_update_dialog_labels_beta(qtbot, monkeypatch):
 
     monkeypatch.setattr(main_window, 'UpdateAvailableDialog', DummyDialog)
 
-    window = DummyMainWindow(DummyConfig(), DummyAuthManager())
-    qtbot.addWidget(window)
-
     window._manual_update_check()
-    assert captured['label'] == 'beta'
+    assert captured['label'] == expected_label
     assert any(mode == 'dark' for _dialog, mode in apply_calls)
-
-
-def test_update_dialog_labels_stable(qtbot, monkeypatch):
-    captured = {}
-
-    update = SimpleNamespace(
-        latest_version='0.2.99',
-        current_version='0.2.0',
-        release_name='Stable Release',
-        release_notes='Stable notes',
-        download_url='',
-        download_size=0,
-        browser_url='',
-        is_prerelease=False,
-    )
-
-    monkeypatch.setattr(main_window, 'check_for_updates', lambda *_args, **_kwargs: update)
-
-    class DummyDialog:
-        Accepted = 1
-
-        def __init__(self, _parent, **kwargs):
-            captured['label'] = kwargs['release_label']
-
-        def exec(self):
-            return 0
-
-    monkeypatch.setattr(main_window, 'UpdateAvailableDialog', DummyDialog)
-
-    window = DummyMainWindow(DummyConfig(), DummyAuthManager())
-    qtbot.addWidget(window)
-
-    window._manual_update_check()
-    assert captured['label'] == 'stable'
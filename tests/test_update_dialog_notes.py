@@ -1,7 +1,10 @@
+import pytest
 from PyQt6.QtWidgets import QDialogButtonBox, QTextBrowser
 
 from src.gui.update_dialog import UpdateAvailableDialog
 
+pytestmark = pytest.mark.qt
+
 
 def test_update_dialog_renders_markdown_links(qtbot):
     dialog = UpdateAvailableDialog(
@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+import os
 import sqlite3
+from contextlib import closing
 from pathlib import Path
 
+import pytest
+from PyQt6.QtCore import QUrl
+
+import src.platforms.base_webview as base_webview
 from src.platforms.base_webview import BaseWebViewPlatform
 from src.utils.constants import PlatformSpecs
 
+_TEST_SPECS = PlatformSpecs(
+    platform_name='TestPlatform',
+    max_image_dimensions=(1024, 1024),
+    max_file_size_mb=5.0,
+    supported_formats=frozenset({'JPEG', 'PNG'}),
+    max_text_length=500,
+    api_type='webview',
+    auth_method='session_cookie',
+    requires_user_confirm=True,
+)
+
+
+# A permalink that matches ConcreteWebViewPlatform.SUCCESS_URL_PATTERN.
+_POST_URL = 'https://example.com/post/12345'
+
 
 class ConcreteWebViewPlatform(BaseWebViewPlatform):
     """Minimal concrete implementation for testing."""
@@ -21,23 +42,16 @@ class ConcreteWebViewPlatform(BaseWebViewPlatform):
         return 'TestPlatform'
 
     def get_specs(self) -> PlatformSpecs:
-        return PlatformSpecs(
-            platform_name='TestPlatform',
-            max_image_dimensions=(1024, 1024),
-            max_file_size_mb=5.0,
-            supported_formats=['JPEG', 'PNG'],
-            max_text_length=500,
-            api_type='webview',
-            auth_method='session_cookie',
-            requires_user_confirm=True,
-        )
-
-
-def test_base_webview_platform_properties():
-    platform = ConcreteWebViewPlatform(
-        account_id='test_1',
-        profile_name='testuser',
-    )
+        return _TEST_SPECS
+
+
+@pytest.fixture(scope='module')
+def platform():
+    """Shared instance for tests that never confirm a post or capture a URL."""
+    return ConcreteWebViewPlatform(account_id='test_1', profile_name='testuser')
+
+
+def test_base_webview_platform_properties(platform):
     assert platform.account_id == 'test_1'
     assert platform.profile_name == 'testuser'
     assert platform.get_platform_name() == 'TestPlatform'
@@ -45,8 +59,7 @@ def test_base_webview_platform_properties():
     assert platform.get_specs().requires_user_confirm is True
 
 
-def test_base_webview_authenticate_returns_ok():
-    platform = ConcreteWebViewPlatform(account_id='test_1')
+def test_base_webview_authenticate_returns_ok(platform):
     success, error = platform.authenticate()
     assert success is True
     assert error is None
@@ -75,17 +88,27 @@ def test_base_webview_build_result_confirmed_no_url():
 def test_base_webview_build_result_confirmed_with_url():
     platform = ConcreteWebViewPlatform(account_id='test_1', profile_name='user')
     platform._post_confirmed = True
-    platform._captured_post_url = 'https://example.com/post/12345'
+    platform._captured_post_url = _POST_URL
     result = platform.build_result()
     assert result.success is True
-    assert result.post_url == 'https://example.com/post/12345'
+    assert result.post_url == _POST_URL
     assert result.url_captured is True
     assert result.user_confirmed is True
 
 
-def test_base_webview_post_returns_error():
+def test_base_webview_url_change_captures_matching_post_url():
+    platform = ConcreteWebViewPlatform(account_id='test_1', profile_name='user')
+
+    platform._on_url_changed(QUrl('https://example.com/compose'))
+    assert platform._captured_post_url is None
+
+    platform._on_url_changed(QUrl(_POST_URL))
+    assert platform._captured_post_url == _POST_URL
+    assert platform._post_confirmed is True
+
+
+def test_base_webview_post_returns_error(platform):
     """post() on a WebView platform should return an error since it needs the panel."""
-    platform = ConcreteWebViewPlatform(account_id='test_1')
     result = platform.post('Hello')
     assert result.success is False
     assert result.error_code == 'WV-PREFILL-FAILED'
@@ -96,38 +119,86 @@ def test_webview_panel_importable():
     from src.gui.webview_panel import WebViewPanel  # noqa: F401
 
 
-def _write_cookie_db(path: Path, host: str):
+@pytest.fixture
+def app_data_dir(monkeypatch, tmp_path):
+    """Point webview profile storage at this test's tmp_path, with a cold session cache."""
+    monkeypatch.setattr(base_webview, 'get_app_data_dir', lambda: tmp_path)
+    monkeypatch.setattr(base_webview, '_SESSION_CACHE', {})
+    return tmp_path
+
+
+def _write_cookie_db(path: Path, *hosts: str):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(path) as conn:
-        cursor = conn.cursor()
-        cursor.execute('CREATE TABLE IF NOT EXISTS cookies (host_key TEXT)')
-        cursor.execute('INSERT INTO cookies (host_key) VALUES (?)', (host,))
-        conn.commit()
+    # Throwaway fixture data: skip the journal file and fsyncs.
+    with closing(sqlite3.connect(path, isolation_level=None)) as conn:
+        conn.execute('PRAGMA journal_mode=MEMORY')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute('BEGIN')
+        conn.execute('CREATE TABLE IF NOT EXISTS cookies (host_key TEXT)')
+        conn.executemany('INSERT INTO cookies (host_key) VALUES (?)', [(h,) for h in hosts])
+        conn.execute('COMMIT')
 
 
-def test_base_webview_has_valid_session_false_without_cookie(monkeypatch, tmp_path):
-    import src.platforms.base_webview as base_webview
+def test_base_webview_has_valid_session_false_without_cookie(platform, app_data_dir):
+    assert platform.has_valid_session() is False
 
-    monkeypatch.setattr(base_webview, 'get_app_data_dir', lambda: tmp_path)
-    platform = ConcreteWebViewPlatform(account_id='test_1')
+
+@pytest.mark.parametrize(
+    ('host', 'expected'),
+    [
+        pytest.param('.example.com', True, id='domain-cookie'),
+        pytest.param('www.example.com', True, id='subdomain-cookie'),
+        pytest.param('.other.test', False, id='foreign-cookie'),
+    ],
+)
+def test_base_webview_has_valid_session_matches_cookie_domain(
+    platform, app_data_dir, host, expected
+):
+    cookie_path = app_data_dir / 'webprofiles' / 'test_1' / 'Cookies'
+    _write_cookie_db(cookie_path, host)
+    assert platform.has_valid_session() is expected
+
+
+def test_base_webview_has_valid_session_checks_every_domain(app_data_dir):
+    class MultiDomainPlatform(ConcreteWebViewPlatform):
+        COOKIE_DOMAINS = ['example.com', 'example.net']
+
+    cookie_path = app_data_dir / 'webprofiles' / 'test_1' / 'Cookies'
+    _write_cookie_db(cookie_path, '.other.test', '.example.net')
+    assert MultiDomainPlatform(account_id='test_1').has_valid_session() is True
+
+
+def test_base_webview_has_valid_session_reuses_verdict_until_db_changes(
+    platform, app_data_dir, monkeypatch
+):
+    cookie_path = app_data_dir / 'webprofiles' / 'test_1' / 'Cookies'
+    _write_cookie_db(cookie_path, '.other.test')
     assert platform.has_valid_session() is False
 
+    # Count only has_valid_session()'s read-only opens, not _write_cookie_db's.
+    reads: list[str] = []
+    real_connect = sqlite3.connect
 
-def test_base_webview_has_valid_session_true_with_cookie(monkeypatch, tmp_path):
-    import src.platforms.base_webview as base_webview
+    def counting_connect(database, *args, **kwargs):
+        if kwargs.get('uri'):
+            reads.append(database)
+        return real_connect(database, *args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, 'connect', counting_connect)
+
+    assert platform.has_valid_session() is False
+    assert reads == []
 
-    monkeypatch.setattr(base_webview, 'get_app_data_dir', lambda: tmp_path)
-    platform = ConcreteWebViewPlatform(account_id='test_1')
-    cookie_path = tmp_path / 'webprofiles' / 'test_1' / 'Cookies'
     _write_cookie_db(cookie_path, '.example.com')
-    assert platform.has_valid_session() is True
+    # Force a visible change even on filesystems with coarse mtimes.
+    stat = cookie_path.stat()
+    os.utime(cookie_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
 
+    assert platform.has_valid_session() is True
+    assert len(reads) == 1
 
-def test_base_webview_test_connection_uses_cookie_check(monkeypatch, tmp_path):
-    import src.platforms.base_webview as base_webview
 
-    monkeypatch.setattr(base_webview, 'get_app_data_dir', lambda: tmp_path)
-    platform = ConcreteWebViewPlatform(account_id='test_1')
+def test_base_webview_test_connection_uses_cookie_check(platform, app_data_dir):
     success, error = platform.test_connection()
     assert success is False
     assert error == 'WV-SESSION-EXPIRED'
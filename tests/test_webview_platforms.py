@@ -1,16 +1,70 @@
 """Tests for concrete WebView platform implementations."""
 
+import pytest
+
 from src.platforms.fansly import FanslyPlatform
 from src.platforms.fetlife import FetLifePlatform
 from src.platforms.onlyfans import OnlyFansPlatform
 from src.platforms.snapchat import SnapchatPlatform
 
-# ── Snapchat ────────────────────────────────────────────────────────
+# ── Shared behaviour ────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ('platform_cls', 'expected_name'),
+    [
+        pytest.param(SnapchatPlatform, 'Snapchat (rinmodel)', id='snapchat'),
+        pytest.param(OnlyFansPlatform, 'OnlyFans (rinmodel)', id='onlyfans'),
+        pytest.param(FanslyPlatform, 'Fansly (rinmodel)', id='fansly'),
+        pytest.param(FetLifePlatform, 'FetLife (rinmodel)', id='fetlife'),
+    ],
+)
+def test_platform_name_includes_profile(platform_cls, expected_name):
+    p = platform_cls(account_id='test_1', profile_name='rinmodel')
+    assert p.get_platform_name() == expected_name
+
+
+@pytest.mark.parametrize(
+    ('platform_cls', 'expected'),
+    [
+        pytest.param(
+            SnapchatPlatform,
+            {
+                'platform_name': 'Snapchat',
+                'api_type': 'webview',
+                'max_accounts': 2,
+                'requires_user_confirm': True,
+            },
+            id='snapchat',
+        ),
+        pytest.param(
+            OnlyFansPlatform,
+            {
+                'platform_name': 'OnlyFans',
+                'has_cloudflare': True,
+                'requires_user_confirm': True,
+                'max_accounts': 1,
+            },
+            id='onlyfans',
+        ),
+        pytest.param(
+            FanslyPlatform,
+            {'platform_name': 'Fansly', 'has_cloudflare': True, 'max_text_length': 3000},
+            id='fansly',
+        ),
+        pytest.param(
+            FetLifePlatform,
+            {'platform_name': 'FetLife', 'has_cloudflare': False, 'max_text_length': None},
+            id='fetlife',
+        ),
+    ],
+)
+def test_platform_specs(platform_cls, expected):
+    specs = platform_cls(account_id='test_1').get_specs()
+    assert {field: getattr(specs, field) for field in expected} == expected
 
 
-def test_snapchat_platform_name():
-    p = SnapchatPlatform(account_id='snapchat_1', profile_name='rin')
-    assert p.get_platform_name() == 'Snapchat (rin)'
+# ── Snapchat ────────────────────────────────────────────────────────
 
 
 def test_snapchat_platform_name_no_profile():
@@ -18,15 +72,6 @@ def test_snapchat_platform_name_no_profile():
     assert p.get_platform_name() == 'Snapchat'
 
 
-def test_snapchat_specs():
-    p = SnapchatPlatform(account_id='snapchat_1')
-    specs = p.get_specs()
-    assert specs.platform_name == 'Snapchat'
-    assert specs.api_type == 'webview'
-    assert specs.max_accounts == 2
-    assert specs.requires_user_confirm is True
-
-
 def test_snapchat_composer_url():
     assert SnapchatPlatform.COMPOSER_URL == 'https://web.snapchat.com/'
 
@@ -41,20 +86,6 @@ def test_snapchat_is_webview():
 # ── OnlyFans ────────────────────────────────────────────────────────
 
 
-def test_onlyfans_platform_name():
-    p = OnlyFansPlatform(account_id='onlyfans_1', profile_name='rinmodel')
-    assert p.get_platform_name() == 'OnlyFans (rinmodel)'
-
-
-def test_onlyfans_specs():
-    p = OnlyFansPlatform(account_id='onlyfans_1')
-    specs = p.get_specs()
-    assert specs.platform_name == 'OnlyFans'
-    assert specs.has_cloudflare is True
-    assert specs.requires_user_confirm is True
-    assert specs.max_accounts == 1
-
-
 def test_onlyfans_prefill_delay():
     assert OnlyFansPlatform.PREFILL_DELAY_MS == 1500
 
@@ -69,19 +100,6 @@ def test_onlyfans_authenticate():
 # ── Fansly ──────────────────────────────────────────────────────────
 
 
-def test_fansly_platform_name():
-    p = FanslyPlatform(account_id='fansly_1', profile_name='rinmodel')
-    assert p.get_platform_name() == 'Fansly (rinmodel)'
-
-
-def test_fansly_specs():
-    p = FanslyPlatform(account_id='fansly_1')
-    specs = p.get_specs()
-    assert specs.platform_name == 'Fansly'
-    assert specs.has_cloudflare is True
-    assert specs.max_text_length == 3000
-
-
 def test_fansly_prefill_delay():
     assert FanslyPlatform.PREFILL_DELAY_MS == 1500
 
@@ -96,29 +114,20 @@ def test_fansly_build_result_not_confirmed():
 # ── FetLife ─────────────────────────────────────────────────────────
 
 
-def test_fetlife_platform_name():
-    p = FetLifePlatform(account_id='fetlife_1', profile_name='rinmodel')
-    assert p.get_platform_name() == 'FetLife (rinmodel)'
-
-
-def test_fetlife_specs():
-    p = FetLifePlatform(account_id='fetlife_1')
-    specs = p.get_specs()
-    assert specs.platform_name == 'FetLife'
-    assert specs.has_cloudflare is False
-    assert specs.max_text_length is None
-
-
 def test_fetlife_composer_url():
     assert FetLifePlatform.COMPOSER_URL == 'https://fetlife.com/statuses/new'
 
 
 def test_fetlife_success_url_pattern():
-    import re
+    regex = FetLifePlatform.SUCCESS_URL_REGEX
+    assert regex is not None
+    assert regex.search('https://fetlife.com/users/12345/statuses/67890')
+    assert not regex.search('https://fetlife.com/')
+
 
-    pattern = FetLifePlatform.SUCCESS_URL_PATTERN
-    assert re.search(pattern, 'https://fetlife.com/users/12345/statuses/67890')
-    assert not re.search(pattern, 'https://fetlife.com/')
+def test_spa_platforms_have_no_success_url_regex():
+    for platform_cls in (SnapchatPlatform, OnlyFansPlatform, FanslyPlatform):
+        assert platform_cls.SUCCESS_URL_REGEX is None
 
 
 def test_fetlife_build_result_confirmed_with_url():